@@ -6,15 +6,25 @@ Main Flask Application
 import os
 import json
 import logging
+import re
 import uuid
 import threading
 import time
 import atexit
+import functools
 from apscheduler.schedulers.background import BackgroundScheduler
 import numpy as np
 from datetime import datetime
-from typing import Any, Dict, Optional
-from flask import Flask, render_template, request, jsonify, make_response
+from typing import Any, Dict, Optional, Tuple
+from flask import (
+    Flask,
+    Response,
+    render_template,
+    request,
+    jsonify,
+    make_response,
+    stream_with_context,
+)
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from dotenv import load_dotenv
@@ -22,6 +32,7 @@ from dotenv import load_dotenv
 # Load environment variables BEFORE importing app modules that read config
 load_dotenv()
 
+from app import json_utils  # noqa: E402
 from app.config import config  # noqa: E402
 from app.exceptions import (  # noqa: E402
     ValidationException,
@@ -67,6 +78,7 @@ app = Flask(__name__, template_folder="app/templates", static_folder="app/static
 
 # Apply configuration from centralized config
 app.config.update(config.flask_config)
+config.ensure_dirs()
 
 # Initialize rate limiter
 limiter = Limiter(
@@ -101,6 +113,16 @@ def scheduled_progress_cleanup():
         logger.error(f"Error in scheduled cleanup: {str(e)}", exc_info=True)
 
 
+def startup_progress_cleanup():
+    """Background task to remove progress files left over from earlier runs."""
+    try:
+        cleaned = progress_tracker.cleanup_all_old_tasks(max_age_hours=1)
+        if cleaned > 0:
+            logger.info(f"Cleaned up {cleaned} old progress file(s) on startup")
+    except Exception as e:
+        logger.warning(f"Error cleaning up progress files on startup: {str(e)}")
+
+
 # Add job to run every 5 minutes
 scheduler.add_job(
     func=scheduled_progress_cleanup,
@@ -163,6 +185,17 @@ def build_error_response(exception: Exception, default_status: int = 400):
     return jsonify(payload), status_code
 
 
+def json_response(payload: Any, status_code: int = 200) -> Response:
+    """Create a JSON response using the fast encoder (orjson when installed).
+
+    Intended for large payloads of plain JSON types; unlike ``jsonify`` the
+    keys are emitted in insertion order.
+    """
+    return Response(
+        json_utils.dumps(payload), status=status_code, mimetype="application/json"
+    )
+
+
 def validate_filename(filename: str, allowed_dir: str) -> str:
     """Validate a filename to prevent path traversal attacks.
 
@@ -198,6 +231,99 @@ def validate_filename(filename: str, allowed_dir: str) -> str:
     return filepath
 
 
+# Expected failure modes when reading data files. Endpoints turn these into a
+# JSON error response; anything else propagates to the 500 error handler.
+_DATA_FILE_ERRORS = (OSError, ValueError, KeyError)
+_ACCURACY_ERRORS = (InternalServerException, *_DATA_FILE_ERRORS)
+
+# Trailing YYYYMMDD of a result filename: result_{game_slug}_{YYYYMMDD}.json
+_RESULT_FILENAME_DATE_RE = re.compile(r"_(\d{8})\.json$")
+
+# Draw fields returned by the verify-result endpoint
+_DRAW_DETAIL_KEYS = ("date", "numbers", "jackpot", "winners", "day_of_week")
+
+
+# Parsed result files keyed by path, as (st_mtime_ns, data). There is one
+# entry per result file rather than a small LRU: the listing endpoints read
+# every file in DATA_PATH on each call and would otherwise evict each other.
+_results_cache: Dict[str, Tuple[int, Dict]] = {}
+_results_cache_lock = threading.Lock()
+
+
+def _load_results(path: str, mtime_ns: int) -> Dict:
+    """Load and parse a result file, memoized on its modification time.
+
+    A cached entry is only reused while the file's modification time is
+    unchanged, so a result file that gets rewritten (e.g. when a new draw is
+    appended) is re-read on the next call instead of serving stale data. The
+    returned dict is shared between callers and must be treated as read-only.
+
+    Args:
+        path: Path to the result JSON file.
+        mtime_ns: Current ``st_mtime_ns`` of the file.
+
+    Returns:
+        Parsed result file contents.
+    """
+    with _results_cache_lock:
+        entry = _results_cache.get(path)
+    if entry is not None and entry[0] == mtime_ns:
+        return entry[1]
+
+    # A single read of the raw bytes (sized from fstat) skips the text
+    # decoding layer and lets json_utils hand the buffer straight to orjson
+    with open(path, "rb") as f:
+        data = json_utils.loads(f.read())
+
+    with _results_cache_lock:
+        _results_cache[path] = (mtime_ns, data)
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _load_results_index(path: str, mtime_ns: int) -> Tuple[Dict[str, Dict], int]:
+    """Index the draws of a result file by PCSO date.
+
+    Args:
+        path: Path to the result JSON file.
+        mtime_ns: ``st_mtime_ns`` of the file; only used as a cache key.
+
+    Returns:
+        Tuple of (draws keyed by their ``MM/DD/YYYY`` date, total draw count).
+    """
+    results = _load_results(path, mtime_ns).get("results", [])
+
+    draws_by_date: Dict[str, Dict] = {}
+    for draw in results:
+        # Keep the first occurrence, matching the previous linear scan
+        if "date" in draw:
+            draws_by_date.setdefault(draw["date"], draw)
+
+    return draws_by_date, len(results)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_scrape_cutoff(filename: str) -> Optional[datetime]:
+    """Extract the original scrape cutoff date from a result filename.
+
+    Args:
+        filename: Result filename (e.g. ``result_Grand_Lotto_6-55_20251031.json``).
+
+    Returns:
+        The cutoff date, or None if the filename does not end in ``YYYYMMDD``.
+    """
+    match = _RESULT_FILENAME_DATE_RE.search(filename)
+    if match is None:
+        return None
+
+    date_str = match.group(1)
+    try:
+        return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
+    except ValueError as e:
+        logger.warning(f"Could not parse scrape cutoff date from filename: {str(e)}")
+    return None
+
+
 @app.after_request
 def set_security_headers(response):
     """Add security headers to all responses."""
@@ -530,7 +656,7 @@ def scrape_data():
         return build_error_response(e, 400)
     except Exception as e:
         logger.error(f"Unexpected error during scraping: {str(e)}", exc_info=True)
-        error = InternalServerException("An unexpected error occurred", details={})
+        error = InternalServerException("An unexpected error occurred")
         return build_error_response(error, 500)
 
 
@@ -708,82 +834,98 @@ def api_analyze():
         return build_error_response(e, 400)
     except Exception as e:
         logger.error(f"Error in API analyze: {str(e)}", exc_info=True)
-        error = InternalServerException("Analysis failed", details={})
+        error = InternalServerException("Analysis failed")
         return build_error_response(error, 500)
 
 
-@app.route("/api/ai-analyze", methods=["POST"])
-@limiter.limit(config.RATE_LIMIT_ANALYZE)
-def api_ai_analyze():
-    """
-    API endpoint for AI-powered analysis.
-    Takes an analysis filename and returns AI interpretation.
+def _prepare_ai_analysis() -> Tuple[AIAnalyzer, Dict, str]:
+    """Load the analysis named in the request and check that Ollama can run it.
+
+    Returns:
+        Tuple of (AI analyzer, analysis data, requested filename)
+
+    Raises:
+        BadRequestException: If AI is disabled or no filename was given
+        DataNotFoundException: If no matching analysis file exists
+        InternalServerException: If Ollama or the model is unavailable
     """
-    try:
-        # Check if AI is enabled
-        if not config.OLLAMA_ENABLED:
-            raise BadRequestException(
-                "AI analysis is not enabled. Set OLLAMA_ENABLED=True in configuration."
-            )
+    # Check if AI is enabled
+    if not config.OLLAMA_ENABLED:
+        raise BadRequestException(
+            "AI analysis is not enabled. Set OLLAMA_ENABLED=True in configuration."
+        )
 
-        data = request.get_json()
-        analysis_filename = data.get("filename")
+    data = request.get_json()
+    analysis_filename = data.get("filename")
 
-        if not analysis_filename:
-            raise BadRequestException("Analysis filename is required")
+    if not analysis_filename:
+        raise BadRequestException("Analysis filename is required")
 
-        # Determine if it's a result or analysis file
-        if analysis_filename.startswith("analysis_"):
-            # It's already an analysis file
-            analysis_path = os.path.join(config.ANALYSIS_PATH, analysis_filename)
-        else:
-            # It's a result file, find the latest analysis
-            # Try to find corresponding analysis file
-            base_name = analysis_filename.replace(".json", "")
-            analysis_files = []
+    # Determine if it's a result or analysis file
+    if analysis_filename.startswith("analysis_"):
+        # It's already an analysis file
+        analysis_path = os.path.join(config.ANALYSIS_PATH, analysis_filename)
+    else:
+        # It's a result file, find the latest analysis
+        # Try to find corresponding analysis file
+        base_name = analysis_filename.replace(".json", "")
+        analysis_files = []
 
-            if os.path.exists(config.ANALYSIS_PATH):
-                for f in os.listdir(config.ANALYSIS_PATH):
-                    if f.startswith(f"analysis_{base_name}_") and f.endswith(".json"):
-                        analysis_files.append(f)
+        if os.path.exists(config.ANALYSIS_PATH):
+            for f in os.listdir(config.ANALYSIS_PATH):
+                if f.startswith(f"analysis_{base_name}_") and f.endswith(".json"):
+                    analysis_files.append(f)
 
-            if not analysis_files:
-                raise DataNotFoundException(
-                    f"No analysis found for {analysis_filename}. Please generate analysis first."
-                )
+        if not analysis_files:
+            raise DataNotFoundException(
+                f"No analysis found for {analysis_filename}. Please generate analysis first."
+            )
 
-            # Get the most recent analysis file
-            analysis_files.sort(reverse=True)
-            analysis_path = os.path.join(config.ANALYSIS_PATH, analysis_files[0])
+        # Get the most recent analysis file
+        analysis_files.sort(reverse=True)
+        analysis_path = os.path.join(config.ANALYSIS_PATH, analysis_files[0])
 
-        # Load analysis data
-        if not os.path.exists(analysis_path):
-            raise DataNotFoundException(f"Analysis file not found: {analysis_filename}")
+    # Load analysis data
+    if not os.path.exists(analysis_path):
+        raise DataNotFoundException(f"Analysis file not found: {analysis_filename}")
 
-        logger.info(f"Loading analysis for AI: {analysis_path}")
+    logger.info(f"Loading analysis for AI: {analysis_path}")
 
-        with open(analysis_path, "r", encoding="utf-8") as f:
-            analysis_data = json.load(f)
+    with open(analysis_path, "r", encoding="utf-8") as f:
+        analysis_data = json.load(f)
 
-        # Initialize AI analyzer
-        ai_analyzer = AIAnalyzer()
+    # Initialize AI analyzer
+    ai_analyzer = AIAnalyzer()
 
-        # Check Ollama status first
-        status = ai_analyzer.check_ollama_status()
-        if not status.get("running"):
-            raise InternalServerException(
-                "Ollama is not running. Please start Ollama service.",
-                details={"error": status.get("error", "Unknown error")},
-            )
+    # Check Ollama status first
+    status = ai_analyzer.check_ollama_status()
+    if not status.get("running"):
+        raise InternalServerException(
+            "Ollama is not running. Please start Ollama service.",
+            details={"error": status.get("error", "Unknown error")},
+        )
 
-        if not status.get("model_available"):
-            raise InternalServerException(
-                f"Model '{ai_analyzer.model}' is not available.",
-                details={
-                    "available_models": status.get("available_models", []),
-                    "configured_model": ai_analyzer.model,
-                },
-            )
+    if not status.get("model_available"):
+        raise InternalServerException(
+            f"Model '{ai_analyzer.model}' is not available.",
+            details={
+                "available_models": status.get("available_models", []),
+                "configured_model": ai_analyzer.model,
+            },
+        )
+
+    return ai_analyzer, analysis_data, analysis_filename
+
+
+@app.route("/api/ai-analyze", methods=["POST"])
+@limiter.limit(config.RATE_LIMIT_ANALYZE)
+def api_ai_analyze():
+    """
+    API endpoint for AI-powered analysis.
+    Takes an analysis filename and returns AI interpretation.
+    """
+    try:
+        ai_analyzer, analysis_data, analysis_filename = _prepare_ai_analysis()
 
         # Perform AI analysis
         logger.info(f"Starting AI analysis for {analysis_filename}")
@@ -808,12 +950,73 @@ def api_ai_analyze():
         return build_error_response(error, 500)
 
 
+@app.route("/api/ai-analyze/stream", methods=["POST"])
+@limiter.limit(config.RATE_LIMIT_ANALYZE)
+def api_ai_analyze_stream():
+    """
+    Stream an AI-powered analysis as server-sent events.
+
+    Takes the same request body as /api/ai-analyze. Emits ``token`` events
+    with the text as the model generates it, then a ``done`` event carrying
+    the full result (or an ``error`` event if generation fails midway).
+    """
+    try:
+        ai_analyzer, analysis_data, analysis_filename = _prepare_ai_analysis()
+    except BadRequestException as e:
+        logger.warning(f"Bad request in AI analyze stream: {str(e)}")
+        return build_error_response(e, 400)
+    except DataNotFoundException as e:
+        logger.warning(f"Data not found in AI analyze stream: {str(e)}")
+        return build_error_response(e, 404)
+    except InternalServerException as e:
+        logger.error(f"Internal error in AI analyze stream: {str(e)}")
+        return build_error_response(e, 500)
+    except Exception as e:
+        logger.error(f"Unexpected error in AI analyze stream: {str(e)}", exc_info=True)
+        return build_error_response(InternalServerException("AI analysis failed"), 500)
+
+    def events():
+        logger.info(f"Starting streamed AI analysis for {analysis_filename}")
+        try:
+            for item in ai_analyzer.analyze_lottery_report_stream(analysis_data):
+                if isinstance(item, str):
+                    yield _sse_event("token", {"content": item})
+                else:
+                    yield _sse_event("done", item)
+            logger.info("Streamed AI analysis completed successfully")
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band. Only
+            # our own exceptions carry a message and details meant for clients.
+            logger.error(f"Streamed AI analysis failed: {str(e)}", exc_info=True)
+            payload = {"success": False, "error": "AI analysis failed"}
+            if isinstance(e, InternalServerException):
+                payload["error"] = e.message
+                if e.details:
+                    payload["details"] = e.details
+            yield _sse_event("error", payload)
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse_event(event: str, payload: Any) -> bytes:
+    """Encode one server-sent event with a JSON payload."""
+    return (
+        b"event: " + event.encode() + b"\ndata: " + json_utils.dumps(payload) + b"\n\n"
+    )
+
+
 @app.route("/api/ollama-status", methods=["GET"])
 def api_ollama_status():
     """Check Ollama service status."""
     try:
+        # ?refresh=true bypasses the cached model list (e.g. after a pull)
+        refresh = request.args.get("refresh", "").lower() == "true"
         ai_analyzer = AIAnalyzer()
-        status = ai_analyzer.check_ollama_status()
+        status = ai_analyzer.check_ollama_status(refresh=refresh)
         return jsonify({"success": True, "status": status})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
@@ -832,8 +1035,7 @@ def api_list_files():
                     filepath = os.path.join(data_path, filename)
 
                     # Get file metadata
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = _load_results(filepath, os.stat(filepath).st_mtime_ns)
 
                     result_files.append(
                         {
@@ -851,7 +1053,7 @@ def api_list_files():
 
     except Exception as e:
         logger.error(f"Error listing files: {str(e)}", exc_info=True)
-        error = InternalServerException("Failed to list files", details={})
+        error = InternalServerException("Failed to list files")
         return jsonify(error.to_response_dict())
 
 
@@ -899,7 +1101,7 @@ def get_analysis_history(filename):
 
     except Exception as e:
         logger.error(f"Error getting analysis history: {str(e)}", exc_info=True)
-        error = InternalServerException("Failed to get analysis history", details={})
+        error = InternalServerException("Failed to get analysis history")
         return jsonify(error.to_response_dict())
 
 
@@ -974,8 +1176,7 @@ def get_result_files_for_game():
                     filepath = os.path.join(data_path, filename)
 
                     # Get file metadata
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = _load_results(filepath, os.stat(filepath).st_mtime_ns)
 
                     result_files.append(
                         {
@@ -997,7 +1198,7 @@ def get_result_files_for_game():
         return build_error_response(e, 400)
     except Exception as e:
         logger.error(f"Error getting result files: {str(e)}", exc_info=True)
-        error = InternalServerException("Failed to list result files", details={})
+        error = InternalServerException("Failed to list result files")
         return build_error_response(error, 500)
 
 
@@ -1202,10 +1403,11 @@ def submit_actual_result():
                 os.makedirs(accuracy_dir, exist_ok=True)
 
                 # Remove outdated snapshots for the same draw to avoid confusion
+                snapshot_prefix = f"accuracy_{game_slug}_"
                 for existing_filename in os.listdir(accuracy_dir):
-                    if not existing_filename.startswith(
-                        f"accuracy_{game_slug}_"
-                    ) or not existing_filename.endswith(".json"):
+                    if not existing_filename.startswith(snapshot_prefix):
+                        continue
+                    if not existing_filename.endswith(".json"):
                         continue
 
                     existing_path = os.path.join(accuracy_dir, existing_filename)
@@ -1240,6 +1442,10 @@ def submit_actual_result():
 
                 with open(accuracy_filepath, "w", encoding="utf-8") as f:
                     json.dump(accuracy_results, f, indent=2, ensure_ascii=False)
+
+                # Make the next accuracy analysis pick up the new snapshot
+                if _accuracy_analyzer is not None:
+                    _accuracy_analyzer.invalidate()
             else:
                 logger.warning(
                     "No suitable analysis snapshot found for %s on %s",
@@ -1265,7 +1471,7 @@ def submit_actual_result():
         return build_error_response(e, 400)
     except Exception as e:
         logger.error(f"Error submitting actual result: {str(e)}", exc_info=True)
-        error = InternalServerException("Failed to submit actual result", details={})
+        error = InternalServerException("Failed to submit actual result")
         return build_error_response(error, 500)
 
 
@@ -1289,7 +1495,7 @@ def delete_report(report_filename):
         return build_error_response(e, 404)
     except Exception as e:
         logger.error(f"Error deleting report: {str(e)}", exc_info=True)
-        error = InternalServerException("Failed to delete report", details={})
+        error = InternalServerException("Failed to delete report")
         return build_error_response(error, 500)
 
 
@@ -1319,7 +1525,7 @@ def export_analysis(report_filename):
         return build_error_response(e, 404)
     except Exception as e:
         logger.error(f"Error exporting analysis: {str(e)}", exc_info=True)
-        error = InternalServerException("Failed to export analysis", details={})
+        error = InternalServerException("Failed to export analysis")
         return build_error_response(error, 500)
 
 
@@ -1365,10 +1571,22 @@ def cleanup_progress():
         return build_error_response(e, 400)
     except Exception as e:
         logger.error(f"Error cleaning up progress files: {str(e)}", exc_info=True)
-        error = InternalServerException("Failed to cleanup progress files", details={})
+        error = InternalServerException("Failed to cleanup progress files")
         return build_error_response(error, 500)
 
 
+# Shared accuracy analyzer, created on first use
+_accuracy_analyzer: Optional[AccuracyAnalyzer] = None
+
+
+def _get_accuracy_analyzer() -> AccuracyAnalyzer:
+    """Return the process-wide AccuracyAnalyzer, creating it on first use."""
+    global _accuracy_analyzer
+    if _accuracy_analyzer is None:
+        _accuracy_analyzer = AccuracyAnalyzer()
+    return _accuracy_analyzer
+
+
 @app.route("/api/accuracy-analysis", methods=["GET"])
 def get_accuracy_analysis():
     """
@@ -1383,7 +1601,7 @@ def get_accuracy_analysis():
     try:
         game_type = request.args.get("game_type")
 
-        analyzer = AccuracyAnalyzer()
+        analyzer = _get_accuracy_analyzer()
         analysis = analyzer.analyze_overall_accuracy(game_type)
 
         return jsonify({"success": True, "data": analysis})
@@ -1391,9 +1609,12 @@ def get_accuracy_analysis():
     except DataNotFoundException as e:
         logger.warning(f"No accuracy data found: {str(e)}")
         return build_error_response(e, 404)
-    except Exception as e:
-        logger.error(f"Error analyzing accuracy: {str(e)}", exc_info=True)
-        error = InternalServerException("Failed to analyze accuracy", details={})
+    except _ACCURACY_ERRORS as e:
+        logger.error(
+            f"Error analyzing accuracy: {str(e)}",
+            exc_info=True,
+        )
+        error = InternalServerException("Failed to analyze accuracy")
         return build_error_response(error, 500)
 
 
@@ -1411,7 +1632,7 @@ def get_accuracy_summary():
     try:
         game_type = request.args.get("game_type")
 
-        analyzer = AccuracyAnalyzer()
+        analyzer = _get_accuracy_analyzer()
         summary = analyzer.get_accuracy_summary(game_type)
 
         return jsonify({"success": True, "data": summary})
@@ -1419,9 +1640,12 @@ def get_accuracy_summary():
     except DataNotFoundException as e:
         logger.warning(f"No accuracy data found: {str(e)}")
         return build_error_response(e, 404)
-    except Exception as e:
-        logger.error(f"Error getting accuracy summary: {str(e)}", exc_info=True)
-        error = InternalServerException("Failed to get accuracy summary", details={})
+    except _ACCURACY_ERRORS as e:
+        logger.error(
+            f"Error getting accuracy summary: {str(e)}",
+            exc_info=True,
+        )
+        error = InternalServerException("Failed to get accuracy summary")
         return build_error_response(error, 500)
 
 
@@ -1432,6 +1656,7 @@ def get_accuracy_provenance():
     Query Parameters:
         game_type: Optional game type filter
         draw_date: Optional draw date filter (YYYY-MM-DD) to narrow to a single submission
+        limit: Optional maximum number of entries to return (most recent first)
 
     Returns:
         JSON containing provenance entries with snapshot context and per-algorithm summaries.
@@ -1439,8 +1664,17 @@ def get_accuracy_provenance():
     try:
         game_type = request.args.get("game_type")
         draw_date_filter = request.args.get("draw_date")
+        raw_limit = request.args.get("limit")
+        limit = None
+        if raw_limit is not None:
+            if not raw_limit.isdecimal():
+                raise BadRequestException(
+                    "Invalid limit",
+                    details={"reason": "limit must be a non-negative integer"},
+                )
+            limit = int(raw_limit)
 
-        analyzer = AccuracyAnalyzer()
+        analyzer = _get_accuracy_analyzer()
         accuracy_files = analyzer.load_all_accuracy_files(game_type)
         if not accuracy_files:
             raise DataNotFoundException(
@@ -1461,17 +1695,21 @@ def get_accuracy_provenance():
                     },
                 )
 
-        provenance = analyzer._build_provenance_summary(accuracy_files)
+        provenance = analyzer._build_provenance_summary(accuracy_files, limit=limit)
 
         return jsonify({"success": True, "data": provenance})
+    except BadRequestException as e:
+        logger.warning(f"Invalid provenance request: {str(e)}")
+        return build_error_response(e, 400)
     except DataNotFoundException as e:
         logger.warning(f"No provenance data: {str(e)}")
         return build_error_response(e, 404)
-    except Exception as e:
-        logger.error(f"Error generating provenance: {str(e)}", exc_info=True)
-        error = InternalServerException(
-            "Failed to generate provenance report", details={}
+    except _ACCURACY_ERRORS as e:
+        logger.error(
+            f"Error generating provenance: {str(e)}",
+            exc_info=True,
         )
+        error = InternalServerException("Failed to generate provenance report")
         return build_error_response(error, 500)
 
 
@@ -1514,8 +1752,8 @@ def verify_result_integrity():
                 ".json"
             ):
                 filepath = os.path.join(data_path, filename)
-                mtime = os.path.getmtime(filepath)
-                result_files.append((filename, filepath, mtime))
+                mtime_ns = os.stat(filepath).st_mtime_ns
+                result_files.append((filename, filepath, mtime_ns))
 
         if not result_files:
             raise DataNotFoundException(
@@ -1528,51 +1766,30 @@ def verify_result_integrity():
         latest_result_file = result_files[0][1]
         latest_result_filename = result_files[0][0]
 
-        # Load result file
-        with open(latest_result_file, "r", encoding="utf-8") as f:
-            result_data = json.load(f)
+        # Load (or reuse) the date index for the result file
+        draws_by_date, total_draws = _load_results_index(
+            latest_result_file, result_files[0][2]
+        )
 
-        # Extract the end date from filename (e.g., result_Grand_Lotto_6-55_20251031.json -> 2025-10-31)
-        # This tells us the original scrape cutoff date
-        original_scrape_cutoff = None
-        try:
-            # Filename format: result_{game_slug}_{YYYYMMDD}.json
-            filename_parts = latest_result_filename.replace(".json", "").split("_")
-            if filename_parts:
-                date_str = filename_parts[-1]  # Last part should be YYYYMMDD
-                if len(date_str) == 8 and date_str.isdigit():
-                    year = date_str[:4]
-                    month = date_str[4:6]
-                    day = date_str[6:8]
-                    original_scrape_cutoff = datetime.strptime(
-                        f"{year}-{month}-{day}", "%Y-%m-%d"
-                    )
-        except Exception as e:
-            logger.warning(
-                f"Could not parse scrape cutoff date from filename: {str(e)}"
-            )
+        # The file's end date tells us the original scrape cutoff date
+        # (e.g., result_Grand_Lotto_6-55_20251031.json -> 2025-10-31)
+        original_scrape_cutoff = _parse_scrape_cutoff(latest_result_filename)
 
-        # Search for matching draw
-        pcso_format_date = draw_date.strftime("%m/%d/%Y")
+        # Look up matching draw
+        pcso_format_date = (
+            f"{draw_date.month:02d}/{draw_date.day:02d}/{draw_date.year:04d}"
+        )
         match_found = None
         is_original_scraped = False
 
-        for draw in result_data.get("results", []):
-            if draw.get("date") == pcso_format_date:
-                match_found = {
-                    "date": draw.get("date"),
-                    "numbers": draw.get("numbers"),
-                    "jackpot": draw.get("jackpot"),
-                    "winners": draw.get("winners"),
-                    "day_of_week": draw.get("day_of_week"),
-                }
+        draw = draws_by_date.get(pcso_format_date)
+        if draw is not None:
+            match_found = {key: draw.get(key) for key in _DRAW_DETAIL_KEYS}
 
-                # Check if this draw was in the original scraped data
-                # If the draw date is ON OR BEFORE the original scrape cutoff date, it was originally scraped
-                if original_scrape_cutoff and draw_date <= original_scrape_cutoff:
-                    is_original_scraped = True
-
-                break
+            # Check if this draw was in the original scraped data
+            # If the draw date is ON OR BEFORE the original scrape cutoff date, it was originally scraped
+            if original_scrape_cutoff and draw_date <= original_scrape_cutoff:
+                is_original_scraped = True
 
         if match_found:
             return jsonify(
@@ -1584,8 +1801,10 @@ def verify_result_integrity():
                     "data": {
                         "source_file": latest_result_filename,
                         "draw_details": match_found,
-                        "original_cutoff_date": original_scrape_cutoff.strftime(
-                            "%Y-%m-%d"
+                        "original_cutoff_date": (
+                            f"{original_scrape_cutoff.year:04d}-"
+                            f"{original_scrape_cutoff.month:02d}-"
+                            f"{original_scrape_cutoff.day:02d}"
                         )
                         if original_scrape_cutoff
                         else None,
@@ -1600,7 +1819,7 @@ def verify_result_integrity():
                     "message": f"Draw result for {draw_date_str} not found in historical data",
                     "data": {
                         "source_file": latest_result_filename,
-                        "total_draws_in_file": len(result_data.get("results", [])),
+                        "total_draws_in_file": total_draws,
                     },
                 }
             )
@@ -1609,9 +1828,12 @@ def verify_result_integrity():
         logger.warning(f"Verification error: {str(e)}")
         status = 404 if isinstance(e, DataNotFoundException) else 400
         return build_error_response(e, status)
-    except Exception as e:
-        logger.error(f"Error verifying result integrity: {str(e)}", exc_info=True)
-        error = InternalServerException("Failed to verify result integrity", details={})
+    except _DATA_FILE_ERRORS as e:
+        logger.error(
+            f"Error verifying result integrity: {str(e)}",
+            exc_info=True,
+        )
+        error = InternalServerException("Failed to verify result integrity")
         return build_error_response(error, 500)
 
 
@@ -1629,82 +1851,121 @@ def list_accuracy_files():
     try:
         game_type = request.args.get("game_type")
 
-        analyzer = AccuracyAnalyzer()
+        analyzer = _get_accuracy_analyzer()
         files = analyzer.load_all_accuracy_files(game_type)
 
         # Return simplified file list
-        file_list = []
-        for file_data in files:
-            file_list.append(
-                {
-                    "filename": file_data.get("filename"),
-                    "game_type": file_data.get("game_type"),
-                    "draw_date": file_data.get("draw_date"),
-                    "actual_numbers": file_data.get("actual_numbers"),
-                    "timestamp": file_data.get("timestamp"),
-                }
-            )
+        file_list = [
+            {
+                "filename": file_data.get("filename"),
+                "game_type": file_data.get("game_type"),
+                "draw_date": file_data.get("draw_date"),
+                "actual_numbers": file_data.get("actual_numbers"),
+                "timestamp": file_data.get("timestamp"),
+            }
+            for file_data in files
+        ]
 
-        return jsonify({"success": True, "total": len(file_list), "data": file_list})
+        return json_response(
+            {"success": True, "total": len(file_list), "data": file_list}
+        )
 
-    except Exception as e:
-        logger.error(f"Error listing accuracy files: {str(e)}", exc_info=True)
-        error = InternalServerException("Failed to list accuracy files", details={})
+    except _ACCURACY_ERRORS as e:
+        logger.error(
+            f"Error listing accuracy files: {str(e)}",
+            exc_info=True,
+        )
+        error = InternalServerException("Failed to list accuracy files")
         return build_error_response(error, 500)
 
 
+@functools.lru_cache(maxsize=4)
+def _render_static_page(template_name: str) -> str:
+    """Render a page that takes no template context (e.g. 404.html)."""
+    return render_template(template_name)
+
+
+@functools.lru_cache(maxsize=8)
+def _render_accuracy_dashboard(summary_json: Optional[bytes]) -> str:
+    """Render the accuracy dashboard for a JSON-encoded summary (None = no data)."""
+    summary = json_utils.loads(summary_json) if summary_json is not None else None
+    return render_template(
+        "accuracy_dashboard.html", has_data=summary is not None, summary=summary
+    )
+
+
+def _cached_render(render, *args) -> str:
+    """Call an lru_cache'd render helper, bypassing the cache in debug mode.
+
+    Keeps template edits visible without a restart during development.
+    """
+    if app.debug:
+        return render.__wrapped__(*args)
+    return render(*args)
+
+
 @app.route("/accuracy-dashboard")
 def accuracy_dashboard():
     """Render accuracy analysis dashboard."""
     try:
-        analyzer = AccuracyAnalyzer()
+        analyzer = _get_accuracy_analyzer()
 
         # Check if there's any accuracy data
         try:
             summary = analyzer.get_accuracy_summary()
-            has_data = True
         except DataNotFoundException:
-            has_data = False
             summary = None
 
-        return render_template(
-            "accuracy_dashboard.html", has_data=has_data, summary=summary
+        # The page only depends on the summary, so key the cache on its JSON
+        summary_json = json_utils.dumps(summary) if summary is not None else None
+        return _cached_render(_render_accuracy_dashboard, summary_json)
+
+    except _ACCURACY_ERRORS as e:
+        logger.error(
+            f"Error rendering accuracy dashboard: {str(e)}",
+            exc_info=True,
         )
+        return _cached_render(_render_static_page, "500.html"), 500
 
-    except Exception as e:
-        logger.error(f"Error rendering accuracy dashboard: {str(e)}", exc_info=True)
-        return render_template("500.html"), 500
+
+# Serialized /health body, shared by all health checks within a second
+_health_cache = {"expires_at": 0.0, "body": b""}
 
 
 @app.route("/health")
 def health():
     """Health check endpoint."""
-    return jsonify({"status": "healthy", "timestamp": datetime.now().isoformat()})
+    now = time.monotonic()
+    if now >= _health_cache["expires_at"]:
+        _health_cache["body"] = json_utils.dumps(
+            {"status": "healthy", "timestamp": datetime.now().isoformat()}
+        )
+        _health_cache["expires_at"] = now + 1.0
+    return Response(_health_cache["body"], mimetype="application/json")
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return render_template("404.html"), 404
+    return _cached_render(_render_static_page, "404.html"), 404
 
 
 @app.errorhandler(500)
 def internal_error(error):
-    """Handle 500 errors."""
-    return render_template("500.html"), 500
+    """Handle 500 errors (JSON for API routes, error page otherwise)."""
+    if request.path.startswith("/api/"):
+        return build_error_response(
+            InternalServerException("An unexpected error occurred"), 500
+        )
+    return _cached_render(_render_static_page, "500.html"), 500
 
 
 if __name__ == "__main__":
-    # Create data directory if it doesn't exist
-    os.makedirs(config.DATA_PATH, exist_ok=True)
-
-    # Cleanup old progress files on startup (older than 1 hour)
-    try:
-        cleaned = progress_tracker.cleanup_all_old_tasks(max_age_hours=1)
-        if cleaned > 0:
-            logger.info(f"Cleaned up {cleaned} old progress file(s) on startup")
-    except Exception as e:
-        logger.warning(f"Error cleaning up progress files on startup: {str(e)}")
+    # Cleanup old progress files on startup (older than 1 hour) in the
+    # background so it doesn't delay the server from accepting requests
+    threading.Thread(
+        target=startup_progress_cleanup, name="startup-progress-cleanup", daemon=True
+    ).start()
 
     # Run the app
     logger.info(
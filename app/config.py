@@ -5,87 +5,85 @@ Centralized configuration management for Fortune Lab.
 
 import os
 import secrets
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
+__all__ = ("Config", "config", "reload_config")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration with environment variable support."""
+    """Application configuration with environment variable support.
+
+    Instances are immutable; use ``reload_config()`` to pick up changed
+    environment variables.
+    """
 
     # Flask Configuration
-    SECRET_KEY: str = os.environ.get("SECRET_KEY", "")
-    DEBUG: bool = os.environ.get("DEBUG", "False").lower() == "true"
-    HOST: str = os.environ.get("HOST", "127.0.0.1")
-    PORT: int = int(os.environ.get("PORT", "5000"))
-    TESTING: bool = os.environ.get("TESTING", "False").lower() == "true"
+    SECRET_KEY: str = ""
+    DEBUG: bool = False
+    HOST: str = "127.0.0.1"
+    PORT: int = 5000
+    TESTING: bool = False
 
     # Data Paths
-    DATA_PATH: str = os.environ.get("DATA_PATH", "app/data")
-    ANALYSIS_PATH: str = os.environ.get("ANALYSIS_PATH", "app/data/analysis")
-    PROGRESS_PATH: str = os.environ.get("PROGRESS_PATH", "app/data/progress")
-    ACCURACY_PATH: str = os.environ.get("ACCURACY_PATH", "app/data/accuracy")
+    DATA_PATH: str = "app/data"
+    ANALYSIS_PATH: str = "app/data/analysis"
+    PROGRESS_PATH: str = "app/data/progress"
+    ACCURACY_PATH: str = "app/data/accuracy"
 
     # Scraper Configuration
-    HEADLESS: bool = os.environ.get("HEADLESS", "True").lower() == "true"
-    PCSO_URL: str = os.environ.get(
-        "PCSO_URL", "https://www.pcso.gov.ph/SearchLottoResult.aspx"
-    )
-    PAGE_TIMEOUT: int = int(os.environ.get("PAGE_TIMEOUT", "30"))
-    MAX_RETRIES: int = int(os.environ.get("MAX_RETRIES", "3"))
+    HEADLESS: bool = True
+    PCSO_URL: str = "https://www.pcso.gov.ph/SearchLottoResult.aspx"
+    PAGE_TIMEOUT: int = 30
+    MAX_RETRIES: int = 3
 
     # Progress Tracking
-    PROGRESS_CLEANUP_AGE: int = int(
-        os.environ.get("PROGRESS_CLEANUP_AGE", "300")
-    )  # 5 minutes
-    PROGRESS_POLL_INTERVAL: int = int(
-        os.environ.get("PROGRESS_POLL_INTERVAL", "2")
-    )  # 2 seconds
+    PROGRESS_CLEANUP_AGE: int = 300  # 5 minutes
+    PROGRESS_POLL_INTERVAL: int = 2  # 2 seconds
 
     # Logging Configuration
-    LOG_LEVEL: str = os.environ.get("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = "INFO"
 
     # Analysis Configuration
-    DEFAULT_PREDICTION_COUNT: int = int(os.environ.get("DEFAULT_PREDICTION_COUNT", "5"))
-    CACHE_ENABLED: bool = os.environ.get("CACHE_ENABLED", "True").lower() == "true"
-    CACHE_TTL: int = int(os.environ.get("CACHE_TTL", "3600"))  # 1 hour
+    DEFAULT_PREDICTION_COUNT: int = 5
+    CACHE_ENABLED: bool = True
+    CACHE_TTL: int = 3600  # 1 hour
+    ACCURACY_LOAD_WORKERS: int = 8  # Threads used to read accuracy files
+    ACCURACY_PARALLEL_MIN_FILES: int = 32  # Read fewer files than this serially
 
     # Default Date Range
-    DEFAULT_START_YEAR: int = int(os.environ.get("DEFAULT_START_YEAR", "2015"))
-    DEFAULT_START_MONTH: int = int(os.environ.get("DEFAULT_START_MONTH", "1"))
-    DEFAULT_START_DAY: int = int(os.environ.get("DEFAULT_START_DAY", "1"))
+    DEFAULT_START_YEAR: int = 2015
+    DEFAULT_START_MONTH: int = 1
+    DEFAULT_START_DAY: int = 1
 
     # Rate Limiting
-    RATE_LIMIT_ENABLED: bool = (
-        os.environ.get("RATE_LIMIT_ENABLED", "False").lower() == "true"
-    )
-    RATE_LIMIT_SCRAPE: str = os.environ.get("RATE_LIMIT_SCRAPE", "10 per hour")
-    RATE_LIMIT_ANALYZE: str = os.environ.get("RATE_LIMIT_ANALYZE", "100 per hour")
-    RATE_LIMIT_GENERAL: str = os.environ.get("RATE_LIMIT_GENERAL", "200 per hour")
+    RATE_LIMIT_ENABLED: bool = False
+    RATE_LIMIT_SCRAPE: str = "10 per hour"
+    RATE_LIMIT_ANALYZE: str = "100 per hour"
+    RATE_LIMIT_GENERAL: str = "200 per hour"
 
     # AI Configuration (Ollama)
-    OLLAMA_ENABLED: bool = os.environ.get("OLLAMA_ENABLED", "True").lower() == "true"
-    OLLAMA_MODEL: str = os.environ.get("OLLAMA_MODEL", "llama3.1:8b")
-    OLLAMA_HOST: str = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
-    OLLAMA_TIMEOUT: int = int(os.environ.get("OLLAMA_TIMEOUT", "120"))  # 2 minutes
+    OLLAMA_ENABLED: bool = True
+    OLLAMA_MODEL: str = "llama3.1:8b"
+    OLLAMA_HOST: str = "http://localhost:11434"
+    OLLAMA_TIMEOUT: int = 120  # 2 minutes
+    OLLAMA_KEEP_ALIVE: str = "60m"  # How long Ollama keeps the model loaded
+    OLLAMA_NUM_PREDICT: int = 2560  # Max tokens per AI response
+    OLLAMA_NUM_CTX: int = 8192  # Context window (prompt + response tokens)
+    OLLAMA_CACHE_SIZE: int = 64  # AI responses kept in memory
+    OLLAMA_CACHE_TTL: int = 86400  # 24 hours; draws don't change intraday
 
     # Feature Flags
-    ENABLE_WEBSOCKET: bool = (
-        os.environ.get("ENABLE_WEBSOCKET", "False").lower() == "true"
-    )
-    ENABLE_API_DOCS: bool = os.environ.get("ENABLE_API_DOCS", "True").lower() == "true"
-    ENABLE_METRICS: bool = os.environ.get("ENABLE_METRICS", "False").lower() == "true"
+    ENABLE_WEBSOCKET: bool = False
+    ENABLE_API_DOCS: bool = True
+    ENABLE_METRICS: bool = False
 
     def __post_init__(self):
         """Validate configuration after initialization."""
         # Generate a random SECRET_KEY if not provided
         if not self.SECRET_KEY:
-            self.SECRET_KEY = secrets.token_hex(32)
-
-        # Ensure required directories exist
-        os.makedirs(self.DATA_PATH, exist_ok=True)
-        os.makedirs(self.ANALYSIS_PATH, exist_ok=True)
-        os.makedirs(self.PROGRESS_PATH, exist_ok=True)
-        os.makedirs(self.ACCURACY_PATH, exist_ok=True)
+            # Frozen dataclass: bypass __setattr__ for this one-time default
+            object.__setattr__(self, "SECRET_KEY", secrets.token_hex(32))
 
         # Validate port range
         if not (1 <= self.PORT <= 65535):
@@ -99,6 +97,13 @@ class Config:
                 f"Must be one of: {', '.join(valid_log_levels)}"
             )
 
+    def ensure_dirs(self) -> None:
+        """Create the configured data directories if they don't exist."""
+        os.makedirs(self.DATA_PATH, exist_ok=True)
+        os.makedirs(self.ANALYSIS_PATH, exist_ok=True)
+        os.makedirs(self.PROGRESS_PATH, exist_ok=True)
+        os.makedirs(self.ACCURACY_PATH, exist_ok=True)
+
     @property
     def flask_config(self) -> dict:
         """Get Flask-specific configuration as dictionary."""
@@ -118,21 +123,43 @@ class Config:
     def __repr__(self) -> str:
         """String representation (masks sensitive values)."""
         safe_attrs = {
-            k: "***MASKED***"
-            if any(s in k.upper() for s in ("SECRET", "KEY", "PASSWORD", "TOKEN"))
-            else v
-            for k, v in self.__dict__.items()
+            f.name: "***MASKED***"
+            if any(s in f.name.upper() for s in ("SECRET", "KEY", "PASSWORD", "TOKEN"))
+            else getattr(self, f.name)
+            for f in fields(self)
         }
         return f"Config({safe_attrs})"
 
 
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable ("true" in any case is True)."""
+    return value.lower() == "true"
+
+
+# (field name, parser) for every Config field, built once from the field
+# types so loading the environment is a single sweep over a flat table.
+_ENV_FIELDS = tuple(
+    (f.name, _parse_bool if f.type is bool else f.type) for f in fields(Config)
+)
+
+
+def _load_from_env() -> dict:
+    """Collect Config overrides from environment variables.
+
+    Only variables that are actually set are returned, so unset ones fall
+    back to the dataclass defaults.
+    """
+    env = os.environ
+    return {name: parse(env[name]) for name, parse in _ENV_FIELDS if name in env}
+
+
 # Global configuration instance
-config = Config()
+config = Config(**_load_from_env())
 
 
 # Convenience function to reload configuration
 def reload_config():
     """Reload configuration from environment variables."""
     global config
-    config = Config()
+    config = Config(**_load_from_env())
     return config
@@ -3,11 +3,15 @@ Custom Exceptions for Fortune Lab
 Provides a hierarchy of exceptions for better error handling and debugging.
 """
 
+from typing import Optional
+
 
 class FortuneLabException(Exception):
     """Base exception for all Fortune Lab errors."""
 
-    def __init__(self, message: str, details: dict = None):
+    __slots__ = ("message", "details", "_error_name")
+
+    def __init__(self, message: str, details: Optional[dict] = None):
         """
         Initialize exception with message and optional details.
 
@@ -16,15 +20,17 @@ class FortuneLabException(Exception):
             details: Optional dictionary with additional error context
         """
         self.message = message
-        self.details = details or {}
+        # Stored as given; an empty dict is only built when serialized
+        self.details = details
+        self._error_name = type(self).__name__
         super().__init__(self.message)
 
     def to_dict(self) -> dict:
         """Convert exception to dictionary for JSON responses."""
         return {
-            "error": self.__class__.__name__,
+            "error": self._error_name,
             "message": self.message,
-            "details": self.details,
+            "details": self.details if self.details is not None else {},
         }
 
 
@@ -245,7 +251,11 @@ class FileWriteException(FileSystemException):
 class APIException(FortuneLabException):
     """Base exception for API errors."""
 
-    def __init__(self, message: str, status_code: int = 500, details: dict = None):
+    __slots__ = ("status_code",)
+
+    def __init__(
+        self, message: str, status_code: int = 500, details: Optional[dict] = None
+    ):
         """
         Initialize API exception with status code.
 
@@ -263,8 +273,8 @@ class APIException(FortuneLabException):
             {
                 "success": False,
                 "error": self.message,
-                "details": self.details,
-                "error_type": self.__class__.__name__,
+                "details": self.details if self.details is not None else {},
+                "error_type": self._error_name,
             },
             self.status_code,
         )
@@ -273,33 +283,35 @@ class APIException(FortuneLabException):
 class BadRequestException(APIException):
     """Bad request (400)."""
 
-    def __init__(self, message: str, details: dict = None):
+    def __init__(self, message: str, details: Optional[dict] = None):
         super().__init__(message, 400, details)
 
 
 class NotFoundException(APIException):
     """Resource not found (404)."""
 
-    def __init__(self, message: str, details: dict = None):
+    def __init__(self, message: str, details: Optional[dict] = None):
         super().__init__(message, 404, details)
 
 
 class ConflictException(APIException):
     """Resource conflict (409)."""
 
-    def __init__(self, message: str, details: dict = None):
+    def __init__(self, message: str, details: Optional[dict] = None):
         super().__init__(message, 409, details)
 
 
 class RateLimitException(APIException):
     """Rate limit exceeded (429)."""
 
-    def __init__(self, message: str = "Rate limit exceeded", details: dict = None):
+    def __init__(
+        self, message: str = "Rate limit exceeded", details: Optional[dict] = None
+    ):
         super().__init__(message, 429, details)
 
 
 class InternalServerException(APIException):
     """Internal server error (500)."""
 
-    def __init__(self, message: str, details: dict = None):
+    def __init__(self, message: str, details: Optional[dict] = None):
         super().__init__(message, 500, details)
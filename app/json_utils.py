@@ -0,0 +1,63 @@
+"""
+JSON Serialization Helpers
+Thin wrappers that use orjson when it is installed and fall back to the
+standard library otherwise.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so catching this
+# handles both backends
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: Raw JSON as bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    *,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        sort_keys: Emit dictionary keys in sorted order
+        default: Fallback for objects the encoder can't handle natively
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj,
+        sort_keys=sort_keys,
+        default=default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
@@ -8,18 +8,76 @@ Author: Fortune Lab Team
 Date: October 30, 2025
 """
 
-import json
+import functools
+import itertools
 import logging
+import operator
 import os
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Any, Set, Tuple
 
+import numpy as np
+
+from app import json_utils
 from app.config import config
 from app.exceptions import DataNotFoundException, InternalServerException
 
 logger = logging.getLogger(__name__)
 
+# (st_mtime_ns, st_size) of an accuracy file when it was parsed
+_FileKey = Tuple[int, int]
+
+
+class _ComparisonColumn(NamedTuple):
+    """One prediction type's comparisons in a file, stored column-wise."""
+
+    matches: np.ndarray
+    ranks: Tuple[Any, ...]
+    sources: Tuple[Dict, ...]
+    total_matches: int
+    best_match: int
+    best_index: int  # first comparison with best_match, -1 if there are none
+    # Drawn & predicted number masks, None where they couldn't be packed
+    common_masks: Tuple[Optional[int], ...]
+
+
+# Comparisons of one file, one column per entry of PREDICTION_TYPES
+_ComparisonRecords = Tuple[_ComparisonColumn, ...]
+
+
+@dataclass
+class _PredictionTypeStats:
+    """Per-prediction match counts and ranks for one prediction algorithm."""
+
+    match_chunks: List[np.ndarray] = field(default_factory=list)
+    ranks: List[Any] = field(default_factory=list)
+    # Filled in by finalize() once the scan is complete
+    match_array: Optional[np.ndarray] = None
+    histogram: Optional[np.ndarray] = None  # predictions with 0-6 matches
+
+    def finalize(self) -> None:
+        """Join the per-file match counts into one array."""
+        # bincount works on intp regardless, so a narrower dtype buys nothing
+        self.match_array = (
+            np.concatenate(self.match_chunks)
+            if self.match_chunks
+            else np.zeros(0, dtype=np.int64)
+        )
+        in_range = (self.match_array >= 0) & (self.match_array <= 6)
+        self.histogram = np.bincount(self.match_array[in_range], minlength=7)
+
+
+@dataclass
+class _AccuracyScan:
+    """Accumulators filled by a single pass over the accuracy files."""
+
+    type_stats: Dict[str, _PredictionTypeStats]
+    best: Dict[str, Dict]
+    recent: List[Dict] = field(default_factory=list)
+    game_stats: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
 
 class AccuracyAnalyzer:
     """
@@ -32,6 +90,39 @@ class AccuracyAnalyzer:
 
     MATCH_HIGHLIGHT_THRESHOLD = 3
 
+    # Game types (including "all") whose analysis and summary are memoized
+    ANALYSIS_CACHE_SIZE = 32
+
+    # (label, display name, comparison key, metrics key) per prediction algorithm
+    PREDICTION_TYPES = (
+        ("top", "Top Predictions", "top_predictions_comparison", "top_predictions"),
+        (
+            "winning",
+            "Winning Predictions",
+            "winning_predictions_comparison",
+            "winning_predictions",
+        ),
+        (
+            "pattern",
+            "Pattern Predictions",
+            "pattern_predictions_comparison",
+            "pattern_predictions",
+        ),
+    )
+
+    # Fields of an accuracy file that the analysis reads; everything else
+    # (e.g. per-algorithm scores) is dropped before the file is cached
+    FILE_FIELDS = (
+        "draw_date",
+        "game_type",
+        "actual_numbers",
+        "analysis_snapshot",
+        "top_predictions_comparison",
+        "winning_predictions_comparison",
+        "pattern_predictions_comparison",
+    )
+    COMPARISON_FIELDS = ("rank", "predicted_numbers", "matches", "matched_numbers")
+
     def __init__(self, accuracy_dir: Optional[str] = None):
         """
         Initialize the AccuracyAnalyzer.
@@ -41,8 +132,33 @@ class AccuracyAnalyzer:
         """
         self.accuracy_dir = accuracy_dir or os.path.join(config.DATA_PATH, "accuracy")
         os.makedirs(self.accuracy_dir, exist_ok=True)
+        # Parsed files by filename, reused while their mtime and size match
+        self._file_cache: Dict[str, Tuple[_FileKey, Dict, _ComparisonRecords]] = {}
+        # Last analysis per game type, keyed on the files it was built from
+        self._metrics_cache: Dict[Optional[str], Tuple[Tuple, Dict]] = {}
+        # Last summary per game type, keyed the same way
+        self._summary_cache: Dict[Optional[str], Tuple[Tuple, Dict]] = {}
         logger.info(f"AccuracyAnalyzer initialized with directory: {self.accuracy_dir}")
 
+    def invalidate(self) -> None:
+        """Drop cached files and analyses, e.g. after writing an accuracy file."""
+        self._file_cache.clear()
+        self._metrics_cache.clear()
+        self._summary_cache.clear()
+
+    def _remember(
+        self,
+        cache: Dict[Optional[str], Tuple[Tuple, Dict]],
+        game_type: Optional[str],
+        fingerprint: Tuple,
+        result: Dict,
+    ) -> None:
+        """Store a result in a per-game-type cache, evicting the oldest entries."""
+        cache.pop(game_type, None)
+        cache[game_type] = (fingerprint, result)
+        while len(cache) > self.ANALYSIS_CACHE_SIZE:
+            del cache[next(iter(cache))]
+
     @staticmethod
     def _get_matched_numbers(
         comparison: Dict, actual_numbers: Optional[List[int]] = None
@@ -52,16 +168,23 @@ class AccuracyAnalyzer:
         if isinstance(matched_numbers, list) and matched_numbers:
             return matched_numbers
 
+        return sorted(AccuracyAnalyzer._intersect_numbers(comparison, actual_numbers))
+
+    @staticmethod
+    def _intersect_numbers(
+        comparison: Dict, actual_numbers: Optional[List[int]]
+    ) -> Set[int]:
+        """Return the set of predicted numbers that were drawn."""
         if actual_numbers is not None:
             predicted_numbers = comparison.get("predicted_numbers")
             if isinstance(predicted_numbers, list) and predicted_numbers:
                 try:
                     actual_set = {int(num) for num in actual_numbers}
                     predicted_set = {int(num) for num in predicted_numbers}
-                    return sorted(actual_set & predicted_set)
+                    return actual_set & predicted_set
                 except TypeError, ValueError:
-                    return []
-        return []
+                    return set()
+        return set()
 
     @staticmethod
     def _get_match_count(
@@ -72,23 +195,294 @@ class AccuracyAnalyzer:
         if isinstance(matched_numbers, list):
             return len(matched_numbers)
 
-        if actual_numbers is not None:
-            derived_matches = AccuracyAnalyzer._get_matched_numbers(
-                comparison, actual_numbers
-            )
-            if derived_matches:
-                return len(derived_matches)
+        # Only the size is needed, so skip sorting the intersection
+        derived_count = len(
+            AccuracyAnalyzer._intersect_numbers(comparison, actual_numbers)
+        )
+        if derived_count:
+            return derived_count
+
+        return AccuracyAnalyzer._get_stored_match_count(comparison)
 
+    @staticmethod
+    def _get_stored_match_count(comparison: Dict) -> int:
+        """Return the ``matches`` value recorded in a comparison."""
         matches = comparison.get("matches", 0)
         try:
             return int(matches)
         except TypeError, ValueError:
             return 0
 
+    @staticmethod
+    def _coerce_numbers(numbers: Any) -> Any:
+        """
+        Convert a list of int-convertible values to ints.
+
+        Args:
+            numbers: Number list as parsed from an accuracy file
+
+        Returns:
+            A list of ints, or ``numbers`` unchanged if it is already one or
+            can't be converted
+        """
+        if not isinstance(numbers, list) or all(
+            isinstance(num, int) for num in numbers
+        ):
+            return numbers
+        try:
+            return list(map(int, numbers))
+        except TypeError, ValueError:
+            return numbers
+
+    @staticmethod
+    def _number_mask(numbers: Any) -> Optional[int]:
+        """
+        Pack lotto numbers into a bitmask with bit ``n`` set for number ``n``.
+
+        Args:
+            numbers: Iterable of numbers, already coerced at load time
+
+        Returns:
+            The bitmask, or None if any number can't be packed
+        """
+        mask = 0
+        try:
+            for num in numbers:
+                if not isinstance(num, int) or not 0 <= num <= 1023:
+                    return None
+                mask |= 1 << num
+        except TypeError:
+            return None
+        return mask
+
+    @staticmethod
+    def _mask_numbers(mask: int) -> List[int]:
+        """Unpack a ``_number_mask`` bitmask into its sorted numbers."""
+        numbers = []
+        while mask:
+            lowest = mask & -mask
+            numbers.append(lowest.bit_length() - 1)
+            mask ^= lowest
+        return numbers
+
+    @classmethod
+    def _common_mask(
+        cls, comparison: Dict, actual_mask: Optional[int]
+    ) -> Optional[int]:
+        """
+        Mask of the numbers a prediction shares with the draw.
+
+        Args:
+            comparison: Prediction comparison
+            actual_mask: ``_number_mask`` of the drawn numbers
+
+        Returns:
+            The shared-number mask, or None if either side can't be packed
+        """
+        if actual_mask is None:
+            return None
+        predicted_numbers = comparison.get("predicted_numbers")
+        if not isinstance(predicted_numbers, list):
+            return None
+        predicted_mask = cls._number_mask(predicted_numbers)
+        if predicted_mask is None:
+            return None
+        return actual_mask & predicted_mask
+
+    @classmethod
+    def _derive_matched_numbers(
+        cls, comparison: Dict, actual_numbers: Any, common_mask: Optional[int]
+    ) -> List[int]:
+        """
+        Same result as ``_get_matched_numbers``, unpacking the shared-number
+        mask worked out at load time instead of intersecting sets.
+
+        Args:
+            comparison: Prediction comparison
+            actual_numbers: Drawn numbers of the file
+            common_mask: ``_common_mask`` of the comparison
+
+        Returns:
+            Matched numbers
+        """
+        matched_numbers = comparison.get("matched_numbers")
+        if isinstance(matched_numbers, list) and matched_numbers:
+            return matched_numbers
+
+        if common_mask is not None:
+            return cls._mask_numbers(common_mask)
+
+        return cls._get_matched_numbers(comparison, actual_numbers)
+
+    @classmethod
+    def _count_matches(
+        cls, comparison: Dict, actual_numbers: Any, common_mask: Optional[int]
+    ) -> int:
+        """
+        Same result as ``_get_match_count``, using a popcount of the
+        shared-number mask rather than intersecting sets when possible.
+
+        Args:
+            comparison: Prediction comparison
+            actual_numbers: Drawn numbers of the file
+            common_mask: ``_common_mask`` of the comparison
+
+        Returns:
+            Number of matched numbers
+        """
+        matched_numbers = comparison.get("matched_numbers")
+        if isinstance(matched_numbers, list):
+            return len(matched_numbers)
+
+        if common_mask is not None:
+            return common_mask.bit_count() or cls._get_stored_match_count(comparison)
+
+        return cls._get_match_count(comparison, actual_numbers)
+
+    @classmethod
+    def _project_accuracy_file(cls, data: Any) -> Any:
+        """
+        Keep only the fields of a parsed accuracy file that the analysis uses.
+
+        Number lists are coerced to ints here, once per file, so the match
+        helpers can work on them without converting every value.
+
+        Args:
+            data: Parsed accuracy file
+
+        Returns:
+            A trimmed copy of the file, or ``data`` unchanged if it isn't a dict
+        """
+        if not isinstance(data, dict):
+            return data
+
+        projected = {key: data[key] for key in cls.FILE_FIELDS if key in data}
+        if "actual_numbers" in projected:
+            projected["actual_numbers"] = cls._coerce_numbers(
+                projected["actual_numbers"]
+            )
+        for _, _, comparison_key, _ in cls.PREDICTION_TYPES:
+            comparisons = projected.get(comparison_key)
+            if not isinstance(comparisons, list):
+                continue
+            projected[comparison_key] = [
+                cls._project_comparison(comp) for comp in comparisons
+            ]
+        return projected
+
+    @classmethod
+    def _project_comparison(cls, comparison: Any) -> Any:
+        """Trim a comparison to COMPARISON_FIELDS and coerce its prediction."""
+        if not isinstance(comparison, dict):
+            return comparison
+        projected = {
+            key: comparison[key] for key in cls.COMPARISON_FIELDS if key in comparison
+        }
+        if "predicted_numbers" in projected:
+            projected["predicted_numbers"] = cls._coerce_numbers(
+                projected["predicted_numbers"]
+            )
+        return projected
+
+    @classmethod
+    def _build_comparison_records(cls, data: Dict) -> _ComparisonRecords:
+        """
+        Work out the match count and rank of every comparison in a file.
+
+        Args:
+            data: Parsed accuracy file
+
+        Returns:
+            One column per prediction type
+        """
+        actual = data.get("actual_numbers", [])
+        actual_mask = cls._number_mask(actual)
+        columns = []
+        for _, _, comparison_key, _ in cls.PREDICTION_TYPES:
+            sources = tuple(data.get(comparison_key) or [])
+            common_masks = tuple(
+                cls._common_mask(comparison, actual_mask) for comparison in sources
+            )
+            matches = np.array(
+                [
+                    cls._count_matches(comparison, actual, common_mask)
+                    for comparison, common_mask in zip(sources, common_masks)
+                ],
+                dtype=np.int64,
+            )
+            ranks = tuple(comparison.get("rank", 0) for comparison in sources)
+            # argmax returns the first occurrence, matching a strict > scan
+            best_index = int(matches.argmax()) if sources else -1
+            columns.append(
+                _ComparisonColumn(
+                    matches=matches,
+                    ranks=ranks,
+                    sources=sources,
+                    total_matches=int(matches.sum()),
+                    best_match=int(matches[best_index]) if sources else 0,
+                    best_index=best_index,
+                    common_masks=common_masks,
+                )
+            )
+        return tuple(columns)
+
+    def _comparison_records(self, file_data: Dict) -> _ComparisonRecords:
+        """Return the precomputed comparisons of a loaded file."""
+        cached = self._file_cache.get(file_data.get("filename"))
+        if cached is not None and cached[1] is file_data:
+            return cached[2]
+        return self._build_comparison_records(file_data)
+
+    def _load_accuracy_file(
+        self, entry: os.DirEntry
+    ) -> Optional[Tuple[_FileKey, Dict]]:
+        """
+        Read and parse a single accuracy file, reusing the cached copy if the
+        file hasn't changed since it was last parsed.
+
+        Args:
+            entry: Directory entry of the accuracy file
+
+        Returns:
+            Tuple of (file key, parsed comparison data), or None if the file
+            couldn't be read
+        """
+        filename = entry.name
+
+        try:
+            # DirEntry caches its stat result (free on Windows, one call here)
+            st = entry.stat()
+            file_key = (st.st_mtime_ns, st.st_size)
+            cached = self._file_cache.get(filename)
+            if cached is not None and cached[0] == file_key:
+                return cached[:2]
+
+            # Read the whole file in one go (the buffer is sized from
+            # fstat) and hand the bytes straight to the decoder, which
+            # uses orjson when it is installed
+            with open(entry.path, "rb") as f:
+                raw = f.read()
+            data = self._project_accuracy_file(json_utils.loads(raw))
+            data["filename"] = filename
+            data["timestamp"] = self._extract_timestamp_from_filename(filename)
+            records = self._build_comparison_records(data)
+            self._file_cache[filename] = (file_key, data, records)
+            return file_key, data
+        except json_utils.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in {filename}: {str(e)}")
+            return None
+        except Exception as e:
+            logger.error(f"Error reading {filename}: {str(e)}")
+            return None
+
     def load_all_accuracy_files(self, game_type: Optional[str] = None) -> List[Dict]:
         """
         Load all accuracy comparison files.
 
+        Each file is trimmed to ``FILE_FIELDS`` plus ``filename`` and
+        ``timestamp``. The returned dictionaries are shared with the file
+        cache and must be treated as read-only.
+
         Args:
             game_type: Optional game type filter (e.g., "Lotto 6/42")
 
@@ -98,47 +492,82 @@ class AccuracyAnalyzer:
         Raises:
             InternalServerException: If file reading fails
         """
-        try:
-            accuracy_files = []
-
-            if not os.path.exists(self.accuracy_dir):
-                logger.warning(
-                    f"Accuracy directory does not exist: {self.accuracy_dir}"
-                )
-                return []
+        return self._load_accuracy_files(game_type)[0]
 
-            for filename in os.listdir(self.accuracy_dir):
-                if not filename.endswith(".json"):
-                    continue
+    def _load_accuracy_files(
+        self, game_type: Optional[str] = None
+    ) -> Tuple[List[Dict], Tuple]:
+        """
+        Load accuracy files along with a fingerprint of what was loaded.
 
-                # Filter by game type if specified
-                if game_type:
-                    game_slug = game_type.replace(" ", "_").replace("/", "-")
-                    if not filename.startswith(f"accuracy_{game_slug}_"):
-                        continue
+        Args:
+            game_type: Optional game type filter (e.g., "Lotto 6/42")
 
-                filepath = os.path.join(self.accuracy_dir, filename)
+        Returns:
+            Tuple of (accuracy files sorted newest first, sorted
+            ``(filename, mtime_ns, size)`` tuples identifying them)
 
-                try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        data["filename"] = filename
-                        data["timestamp"] = self._extract_timestamp_from_filename(
-                            filename
-                        )
-                        accuracy_files.append(data)
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON in {filename}: {str(e)}")
-                    continue
-                except Exception as e:
-                    logger.error(f"Error reading {filename}: {str(e)}")
+        Raises:
+            InternalServerException: If file reading fails
+        """
+        try:
+            try:
+                it = os.scandir(self.accuracy_dir)
+            except FileNotFoundError:
+                logger.warning(
+                    f"Accuracy directory does not exist: {self.accuracy_dir}"
+                )
+                return [], ()
+
+            with it:
+                json_entries = [
+                    entry
+                    for entry in it
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+
+            # Forget files that have been removed from the directory
+            for stale in self._file_cache.keys() - {e.name for e in json_entries}:
+                self._file_cache.pop(stale, None)
+
+            entries = json_entries
+            # Filter by game type if specified
+            if game_type:
+                game_slug = game_type.replace(" ", "_").replace("/", "-")
+                prefix = f"accuracy_{game_slug}_"
+                entries = [e for e in json_entries if e.name.startswith(prefix)]
+
+            # File reads release the GIL, so a thread pool overlaps disk
+            # latency with parsing. map() keeps the listing order, so the
+            # stable sort below gives the same result as a serial load.
+            # Small directories aren't worth the pool's startup cost.
+            workers = config.ACCURACY_LOAD_WORKERS
+            if workers > 1 and len(entries) >= config.ACCURACY_PARALLEL_MIN_FILES:
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="accuracy-loader"
+                ) as executor:
+                    loaded = list(executor.map(self._load_accuracy_file, entries))
+            else:
+                loaded = [self._load_accuracy_file(entry) for entry in entries]
+
+            keyed_files = []
+            fingerprint = []
+            for entry, result in zip(entries, loaded):
+                if result is None:
                     continue
+                file_key, data = result
+                keyed_files.append((data["timestamp"], file_key[0], data))
+                fingerprint.append((entry.name, *file_key))
 
-            # Sort by timestamp (most recent first)
-            accuracy_files.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+            # Sort by timestamp (most recent first). The fixed-width
+            # YYYYMMDD_HHMMSS form compares in chronological order; files
+            # sharing a timestamp (or lacking one) fall back to their mtime
+            # rather than to whatever order the directory listing returned
+            keyed_files.sort(key=operator.itemgetter(0, 1), reverse=True)
+            accuracy_files = [data for _, _, data in keyed_files]
 
             logger.info(f"Loaded {len(accuracy_files)} accuracy files")
-            return accuracy_files
+            return accuracy_files, tuple(sorted(fingerprint))
 
         except Exception as e:
             logger.error(f"Error loading accuracy files: {str(e)}", exc_info=True)
@@ -150,6 +579,9 @@ class AccuracyAnalyzer:
         """
         Analyze overall prediction accuracy across all submissions.
 
+        Results are memoized per game type until the underlying files change
+        and must be treated as read-only.
+
         Args:
             game_type: Optional game type filter
 
@@ -161,38 +593,45 @@ class AccuracyAnalyzer:
             InternalServerException: If analysis fails
         """
         try:
-            accuracy_files = self.load_all_accuracy_files(game_type)
+            accuracy_files, fingerprint = self._load_accuracy_files(game_type)
 
             if not accuracy_files:
                 raise DataNotFoundException(
                     "No accuracy data found", details={"game_type": game_type or "all"}
                 )
 
+            # One timestamp per analysis so every section of the response agrees
+            now_iso = datetime.now().isoformat()
+
+            # Reuse the previous analysis if none of its files have changed
+            cached = self._metrics_cache.get(game_type)
+            if cached is not None and cached[0] == fingerprint:
+                metrics = cached[1]
+                return {
+                    **metrics,
+                    "analysis_date": now_iso,
+                    "provenance": {**metrics["provenance"], "generated_at": now_iso},
+                }
+
+            # Gather every statistic in a single pass over the comparisons
+            scan = self._scan_all(accuracy_files, recent_limit=10)
+
             # Initialize metrics
             metrics = {
                 "total_submissions": len(accuracy_files),
                 "game_type": game_type or "All Games",
-                "analysis_date": datetime.now().isoformat(),
+                "analysis_date": now_iso,
                 "prediction_types": {
-                    "top_predictions": self._analyze_prediction_type(
-                        accuracy_files, "top_predictions_comparison"
-                    ),
-                    "winning_predictions": self._analyze_prediction_type(
-                        accuracy_files, "winning_predictions_comparison"
-                    ),
-                    "pattern_predictions": self._analyze_prediction_type(
-                        accuracy_files, "pattern_predictions_comparison"
-                    ),
+                    metrics_key: self._analyze_prediction_type(scan, comparison_key)
+                    for _, _, comparison_key, metrics_key in self.PREDICTION_TYPES
                 },
-                "best_performances": self._find_best_performances(accuracy_files),
-                "match_distribution": self._calculate_match_distribution(
-                    accuracy_files
-                ),
-                "recent_accuracy": self._calculate_recent_accuracy(
-                    accuracy_files, limit=10
+                "best_performances": self._find_best_performances(scan),
+                "match_distribution": self._calculate_match_distribution(scan),
+                "recent_accuracy": self._calculate_recent_accuracy(scan),
+                "game_breakdown": self._calculate_game_breakdown(scan),
+                "provenance": self._build_provenance_summary(
+                    accuracy_files, now_iso=now_iso
                 ),
-                "game_breakdown": self._calculate_game_breakdown(accuracy_files),
-                "provenance": self._build_provenance_summary(accuracy_files),
             }
 
             # Calculate overall best algorithm
@@ -203,6 +642,7 @@ class AccuracyAnalyzer:
             logger.info(
                 f"Completed overall accuracy analysis: {metrics['total_submissions']} submissions"
             )
+            self._remember(self._metrics_cache, game_type, fingerprint, metrics)
             return metrics
 
         except DataNotFoundException:
@@ -213,145 +653,253 @@ class AccuracyAnalyzer:
                 "Failed to analyze accuracy", details={"error": str(e)}
             )
 
+    def _scan_all(
+        self, accuracy_files: List[Dict], recent_limit: int = 10, details: bool = True
+    ) -> _AccuracyScan:
+        """
+        Collect all aggregate statistics in one pass over the comparisons.
+
+        Each comparison's match count is computed once and feeds every
+        accumulator (per-type stats, best performances, match distribution,
+        recent submissions and per-game breakdown).
+
+        Args:
+            accuracy_files: List of accuracy comparison data (sorted by date)
+            recent_limit: Number of recent submissions to summarize
+            details: Also collect the per-game breakdown and per-type best
+                performances; the summary only needs the overall figures
+
+        Returns:
+            Populated accumulators for the metric builders
+        """
+        scan = _AccuracyScan(
+            type_stats={
+                comparison_key: _PredictionTypeStats()
+                for _, _, comparison_key, _ in self.PREDICTION_TYPES
+            },
+            best={
+                "highest_matches": {"matches": 0, "details": None},
+                "best_top_prediction": {"matches": 0, "details": None},
+                "best_winning_prediction": {"matches": 0, "details": None},
+                "best_pattern_prediction": {"matches": 0, "details": None},
+            },
+        )
+        best = scan.best
+
+        for index, file_data in enumerate(accuracy_files):
+            draw_date = file_data.get("draw_date", "Unknown")
+            game_type = file_data.get("game_type", "Unknown")
+            actual = file_data.get("actual_numbers", [])
+            analysis_snapshot = file_data.get("analysis_snapshot")
+
+            game = None
+            if details:
+                game = scan.game_stats.get(game_type)
+                if game is None:
+                    game = scan.game_stats[game_type] = {
+                        "submissions": 0,
+                        "total_predictions": 0,
+                        "total_matches": 0,
+                        "best_match": 0,
+                    }
+                game["submissions"] += 1
+
+            recent = None
+            if index < recent_limit:
+                recent = {
+                    "draw_date": draw_date,
+                    "game_type": game_type,
+                    "actual_numbers": actual,
+                    "best_match": 0,
+                    "best_prediction_type": None,
+                    "matched_numbers": [],
+                    "analysis_snapshot": analysis_snapshot,
+                }
+
+            records = self._comparison_records(file_data)
+            for (label, display_name, comparison_key, _), column in zip(
+                self.PREDICTION_TYPES, records
+            ):
+                if not column.sources:
+                    continue
+
+                stats = scan.type_stats[comparison_key]
+                best_key = f"best_{label}_prediction"
+
+                stats.match_chunks.append(column.matches)
+                stats.ranks.extend(column.ranks)
+
+                matches = column.best_match
+                if game is not None:
+                    game["total_predictions"] += len(column.sources)
+                    game["total_matches"] += column.total_matches
+                    if matches > game["best_match"]:
+                        game["best_match"] = matches
+
+                # Records only change hands on a strictly better match, so the
+                # column's first best comparison is the only candidate, and
+                # matched numbers are only needed when a record is beaten
+                is_highest = matches > best["highest_matches"]["matches"]
+                is_type_best = details and matches > best[best_key]["matches"]
+                is_recent_best = recent is not None and (matches > recent["best_match"])
+                if not (is_highest or is_type_best or is_recent_best):
+                    continue
+
+                comparison = column.sources[column.best_index]
+                rank = column.ranks[column.best_index]
+                matched_numbers = self._derive_matched_numbers(
+                    comparison, actual, column.common_masks[column.best_index]
+                )
+
+                if is_highest:
+                    best["highest_matches"] = {
+                        "matches": matches,
+                        "details": {
+                            "prediction_type": label,
+                            "draw_date": draw_date,
+                            "game_type": game_type,
+                            "actual_numbers": actual,
+                            "predicted_numbers": comparison.get(
+                                "predicted_numbers", []
+                            ),
+                            "rank": rank,
+                            "matched_numbers": matched_numbers,
+                            "analysis_snapshot": analysis_snapshot,
+                        },
+                    }
+
+                if is_type_best:
+                    best[best_key] = {
+                        "matches": matches,
+                        "details": {
+                            "draw_date": draw_date,
+                            "game_type": game_type,
+                            "actual_numbers": actual,
+                            "predicted_numbers": comparison.get(
+                                "predicted_numbers", []
+                            ),
+                            "rank": rank,
+                            "matched_numbers": matched_numbers,
+                            "analysis_snapshot": analysis_snapshot,
+                        },
+                    }
+
+                if is_recent_best:
+                    recent["best_match"] = matches
+                    recent["best_prediction_type"] = display_name
+                    recent["matched_numbers"] = matched_numbers
+
+            if recent is not None:
+                scan.recent.append(recent)
+
+        for stats in scan.type_stats.values():
+            stats.finalize()
+
+        return scan
+
     def _analyze_prediction_type(
-        self, accuracy_files: List[Dict], comparison_key: str
+        self, scan: _AccuracyScan, comparison_key: str, include_ranks: bool = True
     ) -> Dict:
         """
         Analyze accuracy for a specific prediction type.
 
         Args:
-            accuracy_files: List of accuracy comparison data
+            scan: Accumulators from ``_scan_all``
             comparison_key: Key for prediction comparison (e.g., "top_predictions_comparison")
+            include_ranks: Whether to summarize performance per rank
 
         Returns:
             Dictionary with prediction type metrics
         """
-        total_predictions = 0
-        total_matches = 0
-        match_counts = defaultdict(int)  # Count of predictions with X matches
-        rank_performance = defaultdict(lambda: {"total": 0, "matches": 0})
-
-        for file_data in accuracy_files:
-            actual_numbers = file_data.get("actual_numbers")
-            comparisons = file_data.get(comparison_key, [])
-
-            for comparison in comparisons:
-                matches = self._get_match_count(comparison, actual_numbers)
-                rank = comparison.get("rank", 0)
-
-                total_predictions += 1
-                total_matches += matches
-                match_counts[matches] += 1
-
-                rank_performance[rank]["total"] += 1
-                rank_performance[rank]["matches"] += matches
+        stats = scan.type_stats[comparison_key]
+        total_predictions = int(stats.match_array.size)
+        match_counts = stats.histogram.tolist()
 
         # Calculate metrics
-        avg_matches = total_matches / total_predictions if total_predictions > 0 else 0
-
-        # Convert match distribution to percentage
-        match_distribution = {}
-        for matches in range(7):  # 0-6 matches
-            count = match_counts.get(matches, 0)
-            percentage = (
-                (count / total_predictions * 100) if total_predictions > 0 else 0
-            )
-            match_distribution[f"{matches}_matches"] = {
-                "count": count,
-                "percentage": round(percentage, 2),
-            }
+        avg_matches = (
+            int(stats.match_array.sum()) / total_predictions
+            if total_predictions > 0
+            else 0
+        )
 
-        # Analyze rank performance
-        rank_stats = {}
-        for rank, stats in sorted(rank_performance.items()):
-            avg_rank_matches = (
-                stats["matches"] / stats["total"] if stats["total"] > 0 else 0
+        # Convert match distribution to percentage, all 7 buckets (0-6
+        # matches) at once; the nested dicts are only built for the response
+        if total_predictions > 0:
+            percentages = (stats.histogram / total_predictions * 100).tolist()
+        else:
+            percentages = [0] * 7
+        match_distribution = {
+            f"{matches}_matches": {"count": count, "percentage": round(percentage, 2)}
+            for matches, (count, percentage) in enumerate(
+                zip(match_counts, percentages)
             )
-            rank_stats[f"rank_{rank}"] = {
-                "total_predictions": stats["total"],
-                "avg_matches": round(avg_rank_matches, 2),
-            }
+        }
 
         return {
             "total_predictions": total_predictions,
             "avg_matches_per_prediction": round(avg_matches, 2),
             "match_distribution": match_distribution,
-            "rank_performance": rank_stats,
-            "jackpot_hits": match_counts.get(6, 0),  # 6 matches = jackpot
-            "five_number_hits": match_counts.get(5, 0),
-            "four_number_hits": match_counts.get(4, 0),
+            "rank_performance": self._summarize_ranks(stats) if include_ranks else {},
+            "jackpot_hits": match_counts[6],  # 6 matches = jackpot
+            "five_number_hits": match_counts[5],
+            "four_number_hits": match_counts[4],
         }
 
-    def _find_best_performances(self, accuracy_files: List[Dict]) -> Dict:
+    @staticmethod
+    def _summarize_ranks(stats: _PredictionTypeStats) -> Dict:
         """
-        Find best performing predictions across all types.
+        Summarize how predictions performed at each rank.
 
         Args:
-            accuracy_files: List of accuracy comparison data
+            stats: Finalized stats for one prediction type
 
         Returns:
-            Dictionary with best performances
+            Dictionary keyed by ``rank_<n>`` in ascending rank order
         """
-        best = {
-            "highest_matches": {"matches": 0, "details": None},
-            "best_top_prediction": {"matches": 0, "details": None},
-            "best_winning_prediction": {"matches": 0, "details": None},
-            "best_pattern_prediction": {"matches": 0, "details": None},
+        if not stats.ranks:
+            return {}
+
+        ranks = np.asarray(stats.ranks)
+        if ranks.dtype.kind not in "biu":
+            # Mixed or non-scalar ranks from hand-edited files; group in Python
+            totals: Dict[Any, List[int]] = {}
+            for rank, matches in zip(stats.ranks, stats.match_array.tolist()):
+                rank_totals = totals.get(rank)
+                if rank_totals is None:
+                    rank_totals = totals[rank] = [0, 0]
+                rank_totals[0] += 1
+                rank_totals[1] += matches
+            return {
+                f"rank_{rank}": {
+                    "total_predictions": count,
+                    "avg_matches": round(match_sum / count, 2),
+                }
+                for rank, (count, match_sum) in sorted(totals.items())
+            }
+
+        unique_ranks, inverse = np.unique(ranks, return_inverse=True)
+        counts = np.bincount(inverse)
+        match_sums = np.bincount(inverse, weights=stats.match_array)
+        return {
+            f"rank_{rank}": {
+                "total_predictions": int(count),
+                "avg_matches": round(float(match_sum) / int(count), 2),
+            }
+            for rank, count, match_sum in zip(unique_ranks.tolist(), counts, match_sums)
         }
 
-        for file_data in accuracy_files:
-            draw_date = file_data.get("draw_date", "Unknown")
-            game_type = file_data.get("game_type", "Unknown")
-            actual = file_data.get("actual_numbers", [])
-            analysis_snapshot = file_data.get("analysis_snapshot")
+    def _find_best_performances(self, scan: _AccuracyScan) -> Dict:
+        """
+        Find best performing predictions across all types.
+
+        Args:
+            scan: Accumulators from ``_scan_all``
+
+        Returns:
+            Dictionary with best performances
+        """
+        best = dict(scan.best)
 
-            # Check all prediction types
-            for pred_type, key in [
-                ("top", "top_predictions_comparison"),
-                ("winning", "winning_predictions_comparison"),
-                ("pattern", "pattern_predictions_comparison"),
-            ]:
-                comparisons = file_data.get(key, [])
-
-                for comparison in comparisons:
-                    matches = self._get_match_count(comparison, actual)
-                    matched_numbers = self._get_matched_numbers(comparison, actual)
-
-                    # Update overall highest
-                    if matches > best["highest_matches"]["matches"]:
-                        best["highest_matches"] = {
-                            "matches": matches,
-                            "details": {
-                                "prediction_type": pred_type,
-                                "draw_date": draw_date,
-                                "game_type": game_type,
-                                "actual_numbers": actual,
-                                "predicted_numbers": comparison.get(
-                                    "predicted_numbers", []
-                                ),
-                                "rank": comparison.get("rank", 0),
-                                "matched_numbers": matched_numbers,
-                                "analysis_snapshot": file_data.get("analysis_snapshot"),
-                            },
-                        }
-
-                    # Update type-specific best
-                    best_key = f"best_{pred_type}_prediction"
-                    if matches > best[best_key]["matches"]:
-                        best[best_key] = {
-                            "matches": matches,
-                            "details": {
-                                "draw_date": draw_date,
-                                "game_type": game_type,
-                                "actual_numbers": actual,
-                                "predicted_numbers": comparison.get(
-                                    "predicted_numbers", []
-                                ),
-                                "rank": comparison.get("rank", 0),
-                                "matched_numbers": matched_numbers,
-                                "analysis_snapshot": analysis_snapshot,
-                            },
-                        }
         # Threshold logic
         threshold = self.MATCH_HIGHLIGHT_THRESHOLD
         for algo_key in [
@@ -372,148 +920,77 @@ class AccuracyAnalyzer:
 
         return best
 
-    def _calculate_match_distribution(self, accuracy_files: List[Dict]) -> Dict:
+    def _calculate_match_distribution(self, scan: _AccuracyScan) -> Dict:
         """
         Calculate overall match distribution across all predictions.
 
         Args:
-            accuracy_files: List of accuracy comparison data
+            scan: Accumulators from ``_scan_all``
 
         Returns:
             Dictionary with match distribution statistics
         """
-        all_matches = []
-
-        for file_data in accuracy_files:
-            actual_numbers = file_data.get("actual_numbers")
-            for key in [
-                "top_predictions_comparison",
-                "winning_predictions_comparison",
-                "pattern_predictions_comparison",
-            ]:
-                comparisons = file_data.get(key, [])
-                for comparison in comparisons:
-                    all_matches.append(
-                        self._get_match_count(comparison, actual_numbers)
-                    )
-
-        if not all_matches:
+        type_stats = scan.type_stats.values()
+        total_predictions = sum(int(stats.match_array.size) for stats in type_stats)
+        if not total_predictions:
             return {}
 
+        match_sum = sum(int(stats.match_array.sum()) for stats in type_stats)
+        buckets = sum(stats.histogram for stats in type_stats).tolist()
         return {
-            "total_predictions": len(all_matches),
+            "total_predictions": total_predictions,
             "distribution": {
-                "0_matches": all_matches.count(0),
-                "1_match": all_matches.count(1),
-                "2_matches": all_matches.count(2),
-                "3_matches": all_matches.count(3),
-                "4_matches": all_matches.count(4),
-                "5_matches": all_matches.count(5),
-                "6_matches_jackpot": all_matches.count(6),
+                "0_matches": buckets[0],
+                "1_match": buckets[1],
+                "2_matches": buckets[2],
+                "3_matches": buckets[3],
+                "4_matches": buckets[4],
+                "5_matches": buckets[5],
+                "6_matches_jackpot": buckets[6],
             },
-            "average_matches": round(sum(all_matches) / len(all_matches), 2),
+            "average_matches": round(match_sum / total_predictions, 2),
         }
 
-    def _calculate_recent_accuracy(
-        self, accuracy_files: List[Dict], limit: int = 10
-    ) -> List[Dict]:
+    def _calculate_recent_accuracy(self, scan: _AccuracyScan) -> List[Dict]:
         """
         Calculate accuracy for recent submissions.
 
         Args:
-            accuracy_files: List of accuracy comparison data (sorted by date)
-            limit: Number of recent submissions to include
+            scan: Accumulators from ``_scan_all``
 
         Returns:
             List of recent submission summaries
         """
         recent = []
+        threshold = self.MATCH_HIGHLIGHT_THRESHOLD
 
-        for file_data in accuracy_files[:limit]:
-            summary = {
-                "draw_date": file_data.get("draw_date", "Unknown"),
-                "game_type": file_data.get("game_type", "Unknown"),
-                "actual_numbers": file_data.get("actual_numbers", []),
-                "best_match": 0,
-                "best_prediction_type": None,
-                "matched_numbers": [],
-                "analysis_snapshot": file_data.get("analysis_snapshot"),
-            }
-
-            # Find best match across all prediction types
-            for pred_type, key in [
-                ("Top Predictions", "top_predictions_comparison"),
-                ("Winning Predictions", "winning_predictions_comparison"),
-                ("Pattern Predictions", "pattern_predictions_comparison"),
-            ]:
-                comparisons = file_data.get(key, [])
-                for comparison in comparisons:
-                    matches = self._get_match_count(
-                        comparison,
-                        summary["actual_numbers"],
-                    )
-                    if matches > summary["best_match"]:
-                        summary["best_match"] = matches
-                        summary["best_prediction_type"] = pred_type
-                        summary["matched_numbers"] = self._get_matched_numbers(
-                            comparison,
-                            summary["actual_numbers"],
-                        )
-
+        for summary in scan.recent:
             # Apply threshold: only show best_match if >= threshold
-            threshold = self.MATCH_HIGHLIGHT_THRESHOLD
             if summary["best_match"] < threshold:
-                summary["best_match"] = 0
-                summary["best_prediction_type"] = None
-                summary["matched_numbers"] = []
-
+                summary = {
+                    **summary,
+                    "best_match": 0,
+                    "best_prediction_type": None,
+                    "matched_numbers": [],
+                }
             recent.append(summary)
 
         return recent
 
-    def _calculate_game_breakdown(self, accuracy_files: List[Dict]) -> Dict:
+    def _calculate_game_breakdown(self, scan: _AccuracyScan) -> Dict:
         """
         Calculate accuracy breakdown by game type.
 
         Args:
-            accuracy_files: List of accuracy comparison data
+            scan: Accumulators from ``_scan_all``
 
         Returns:
             Dictionary with per-game statistics
         """
-        game_stats = defaultdict(
-            lambda: {
-                "submissions": 0,
-                "total_predictions": 0,
-                "total_matches": 0,
-                "best_match": 0,
-            }
-        )
-
-        for file_data in accuracy_files:
-            game = file_data.get("game_type", "Unknown")
-            actual_numbers = file_data.get("actual_numbers")
-            game_stats[game]["submissions"] += 1
-
-            # Count all predictions and matches
-            for key in [
-                "top_predictions_comparison",
-                "winning_predictions_comparison",
-                "pattern_predictions_comparison",
-            ]:
-                comparisons = file_data.get(key, [])
-                for comparison in comparisons:
-                    matches = self._get_match_count(comparison, actual_numbers)
-                    game_stats[game]["total_predictions"] += 1
-                    game_stats[game]["total_matches"] += matches
-                    game_stats[game]["best_match"] = max(
-                        game_stats[game]["best_match"], matches
-                    )
-
         # Calculate averages and apply threshold
         result = {}
         threshold = self.MATCH_HIGHLIGHT_THRESHOLD
-        for game, stats in game_stats.items():
+        for game, stats in scan.game_stats.items():
             avg_matches = (
                 stats["total_matches"] / stats["total_predictions"]
                 if stats["total_predictions"] > 0
@@ -561,7 +1038,12 @@ class AccuracyAnalyzer:
 
         return algorithms[0] if algorithms else {}
 
-    def _build_provenance_summary(self, accuracy_files: List[Dict]) -> Dict:
+    def _build_provenance_summary(
+        self,
+        accuracy_files: Iterable[Dict],
+        limit: Optional[int] = None,
+        now_iso: Optional[str] = None,
+    ) -> Dict:
         """Build a lightweight provenance / explanation layer.
 
         For each submission (accuracy file) we capture:
@@ -571,9 +1053,32 @@ class AccuracyAnalyzer:
           - overall_highest_match for the submission
 
         This supports the forthcoming /api/accuracy-provenance endpoint and UI explanatory report.
+
+        Args:
+            accuracy_files: Accuracy comparison data (sorted by date)
+            limit: Maximum number of entries to build; all of them if None
+            now_iso: Timestamp to report as generated_at; the current time if None
+        """
+        generated_at = now_iso or datetime.now().isoformat()
+        provenance_entries = list(
+            itertools.islice(self.iter_provenance(accuracy_files), limit)
+        )
+
+        return {
+            "entries": provenance_entries,
+            "generated_at": generated_at,
+        }
+
+    def iter_provenance(self, accuracy_files: Iterable[Dict]) -> Iterator[Dict]:
         """
-        provenance_entries: List[Dict] = []
+        Yield provenance entries one submission at a time.
 
+        Args:
+            accuracy_files: Accuracy comparison data (sorted by date)
+
+        Yields:
+            Provenance entry for each accuracy file, in order
+        """
         for file_data in accuracy_files:
             entry: Dict[str, Any] = {
                 "draw_date": file_data.get("draw_date"),
@@ -593,44 +1098,29 @@ class AccuracyAnalyzer:
                     "filename": snapshot.get("filename"),
                 }
 
-            # Iterate prediction types
-            for label, key in [
-                ("top", "top_predictions_comparison"),
-                ("winning", "winning_predictions_comparison"),
-                ("pattern", "pattern_predictions_comparison"),
-            ]:
-                comparisons = file_data.get(key, []) or []
-                best_rank = None
-                best_match = -1
-                total_predictions = 0
-                cumulative_matches = 0
-                for comp in comparisons:
-                    total_predictions += 1
-                    matches = self._get_match_count(
-                        comp, file_data.get("actual_numbers")
-                    )
-                    cumulative_matches += matches
-                    if matches > best_match:
-                        best_match = matches
-                        best_rank = comp.get("rank")
-                    entry["overall_highest_match"] = max(
-                        entry["overall_highest_match"], matches
-                    )
-                if total_predictions:
-                    entry["algorithms"][label] = {
-                        "best_rank": best_rank,
-                        "best_match": max(best_match, 0),
-                        "avg_matches": round(cumulative_matches / total_predictions, 2),
-                        "predictions": total_predictions,
-                    }
-            provenance_entries.append(entry)
+            # Match counts were worked out when the file was loaded
+            records = self._comparison_records(file_data)
+            for (label, _, _, _), column in zip(self.PREDICTION_TYPES, records):
+                total_predictions = len(column.sources)
+                if not total_predictions:
+                    continue
 
-        return {
-            "entries": provenance_entries,
-            "generated_at": datetime.now().isoformat(),
-        }
+                best_match = column.best_match
+                best_rank = column.sources[column.best_index].get("rank")
+                entry["overall_highest_match"] = max(
+                    entry["overall_highest_match"], best_match
+                )
+                entry["algorithms"][label] = {
+                    "best_rank": best_rank,
+                    "best_match": best_match,
+                    "avg_matches": round(column.total_matches / total_predictions, 2),
+                    "predictions": total_predictions,
+                }
+            yield entry
 
-    def _extract_timestamp_from_filename(self, filename: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_timestamp_from_filename(filename: str) -> str:
         """
         Extract timestamp from accuracy filename.
 
@@ -642,10 +1132,10 @@ class AccuracyAnalyzer:
         """
         try:
             # Expected format: accuracy_{game_slug}_{YYYYMMDD_HHMMSS}.json
-            parts = filename.replace(".json", "").split("_")
-            if len(parts) >= 3:
+            parts = filename.replace(".json", "").rsplit("_", 2)
+            if len(parts) == 3:
                 # Last two parts should be date and time
-                return f"{parts[-2]}_{parts[-1]}"
+                return f"{parts[1]}_{parts[2]}"
             return ""
         except Exception:
             return ""
@@ -654,6 +1144,9 @@ class AccuracyAnalyzer:
         """
         Get a quick summary of accuracy metrics.
 
+        Results are memoized per game type until the underlying files change
+        and must be treated as read-only.
+
         Args:
             game_type: Optional game type filter
 
@@ -664,9 +1157,39 @@ class AccuracyAnalyzer:
             DataNotFoundException: If no accuracy files found
         """
         try:
-            full_analysis = self.analyze_overall_accuracy(game_type)
+            accuracy_files, fingerprint = self._load_accuracy_files(game_type)
 
-            return {
+            if not accuracy_files:
+                raise DataNotFoundException(
+                    "No accuracy data found", details={"game_type": game_type or "all"}
+                )
+
+            cached = self._summary_cache.get(game_type)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+
+            cached = self._metrics_cache.get(game_type)
+            if cached is not None and cached[0] == fingerprint:
+                full_analysis = cached[1]
+            else:
+                # Only the overall figures are needed here, so skip the
+                # per-game, recent, per-rank and provenance work
+                scan = self._scan_all(accuracy_files, recent_limit=0, details=False)
+                prediction_types = {
+                    metrics_key: self._analyze_prediction_type(
+                        scan, comparison_key, include_ranks=False
+                    )
+                    for _, _, comparison_key, metrics_key in self.PREDICTION_TYPES
+                }
+                full_analysis = {
+                    "total_submissions": len(accuracy_files),
+                    "game_type": game_type or "All Games",
+                    "best_algorithm": self._determine_best_algorithm(prediction_types),
+                    "match_distribution": self._calculate_match_distribution(scan),
+                    "best_performances": self._find_best_performances(scan),
+                }
+
+            summary = {
                 "total_submissions": full_analysis["total_submissions"],
                 "game_type": full_analysis["game_type"],
                 "best_algorithm": full_analysis["best_algorithm"],
@@ -688,7 +1211,13 @@ class AccuracyAnalyzer:
                     "highest_matches"
                 ],
             }
+            self._remember(self._summary_cache, game_type, fingerprint, summary)
+            return summary
 
+        except DataNotFoundException, InternalServerException:
+            raise
         except Exception as e:
             logger.error(f"Error getting accuracy summary: {str(e)}", exc_info=True)
-            raise
+            raise InternalServerException(
+                "Failed to get accuracy summary", details={"error": str(e)}
+            )
@@ -4,15 +4,209 @@ Uses Ollama (llama3.1:8b) to provide intelligent analysis and predictions
 based on lottery statistical data.
 """
 
+import asyncio
+import functools
+import hashlib
+import heapq
+import io
 import logging
-from typing import Dict, List, Optional, Any
+import operator
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 import ollama
 
+from app import json_utils
 from app.config import config
 from app.exceptions import InternalServerException
 
 logger = logging.getLogger(__name__)
 
+# AI responses by analysis fingerprint, shared by every AIAnalyzer since the
+# app creates one per request: key -> (monotonic time stored, result)
+_response_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Models reported by the Ollama server, refreshed at most every
+# _MODEL_LIST_TTL seconds: (monotonic time fetched, model names)
+_MODEL_LIST_TTL = 30.0
+_model_list_cache: Optional[Tuple[float, List[str]]] = None
+_model_list_lock = threading.Lock()
+
+# Sentinel the prompt asks the model to finish with; generation stops there
+# instead of running on to num_predict
+_END_OF_ANALYSIS = "###### END OF ANALYSIS"
+_END_INSTRUCTION = (
+    f"After the disclaimer, end your response with this line on its own: "
+    f"{_END_OF_ANALYSIS}"
+)
+
+# Context budget. Prompt tokens are estimated from characters: the digits,
+# tables and emoji in these prompts run close to 3 characters per token on
+# Llama-family tokenizers, so the estimate errs on the long side.
+_CHARS_PER_TOKEN = 3
+_CONTEXT_RESERVE = 512  # Chat template and estimate slack
+# Sections left out, in order, when a prompt doesn't fit the context
+_DROPPABLE_SECTIONS = ("historical_observations", "temporal_patterns")
+
+# Most pattern rows listed per distribution in the prompt
+_MAX_PATTERN_ROWS = 20
+
+_MONTH_NAMES = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+_DAYS_ORDER = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+
+# Kept byte-identical across calls: Ollama reuses the KV cache for a
+# matching prompt prefix, so only the statistics at the tail of each
+# request need prefill
+_SYSTEM_PROMPT_TEXT = (
+    "You are an expert statistician and data analyst specializing in Philippine PCSO (Philippine Charity Sweepstakes Office) lottery analysis. "
+    "You have deep knowledge of probability theory, statistical analysis, and pattern recognition. "
+    "Your role is to analyze historical lottery draw data and provide intelligent, data-driven insights.\n\n"
+    "IMPORTANT CONTEXT:\n"
+    "- The Philippine PCSO operates multiple lottery games (Ultra Lotto 6/58, Grand Lotto 6/55, Super Lotto 6/49, Mega Lotto 6/45, Lotto 6/42)\n"
+    "- Each game draws a specific number of balls from a fixed range (e.g., 6/58 means pick 6 numbers from 1-58)\n"
+    "- Draws occur 2-3 times per week depending on the game\n"
+    "- All draws are random and independent events\n\n"
+    "YOUR ANALYTICAL APPROACH:\n"
+    "1. Identify statistically significant patterns in the data\n"
+    "2. Consider frequency analysis (hot/cold numbers)\n"
+    "3. Examine distribution patterns (even/odd, high/low, consecutive)\n"
+    "4. Analyze temporal trends (day of week patterns, recent vs historical)\n"
+    "5. Evaluate multiple prediction algorithms\n"
+    "6. Always acknowledge that past results do NOT guarantee future outcomes\n\n"
+    "RESPONSE STYLE:\n"
+    "- Be analytical but accessible to non-technical users\n"
+    "- Use clear explanations without excessive jargon\n"
+    "- Provide actionable insights\n"
+    "- Always include a responsible gaming disclaimer\n"
+    "- Format in markdown for readability"
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_game_type(game_type: str) -> Tuple[int, int, float]:
+    """
+    Parse the game parameters out of a game type name.
+
+    Args:
+        game_type: Game type such as "Ultra Lotto 6/58"
+
+    Returns:
+        Tuple of (max_num, numbers_to_pick, numbers_to_pick / max_num)
+    """
+    max_num = int(game_type.split("/")[-1])
+    numbers_to_pick = int(game_type.split("/")[0].split()[-1])
+    return max_num, numbers_to_pick, numbers_to_pick / max_num
+
+
+@functools.lru_cache(maxsize=16)
+def _prompt_header(game_type: str) -> str:
+    """
+    Return the static part of the analysis prompt for a game.
+
+    The header holds the game rules and the task specification, which don't
+    depend on the statistics, so it is built once per game type and reused
+    verbatim across requests.
+
+    Args:
+        game_type: Type of lottery game
+
+    Returns:
+        Prompt header ending with a section separator
+    """
+    max_num, numbers_to_pick, _ = _parse_game_type(game_type)
+    return f"""# PCSO Lottery Statistical Analysis Request
+
+## 📊 LOTTERY GAME INFORMATION
+
+**Game Type:** {game_type} (Philippine PCSO)
+**Number Range:** 1 to {max_num}
+**Numbers Per Draw:** {numbers_to_pick} numbers
+
+---
+
+## 🎯 YOUR ANALYTICAL TASK
+
+Using the statistical data that follows, please provide a comprehensive analysis in the following format:
+
+### 1. EXECUTIVE SUMMARY (3-4 paragraphs)
+High-level overview of the most important findings from the draw dataset. Key statistical patterns, surprising trends, and what makes this game's distribution unique.
+
+### 2. STATISTICAL INSIGHTS (Detailed Analysis)
+
+**a) Frequency Analysis Interpretation:**
+- What do the hot/cold number patterns tell us?
+- Are there any statistically significant deviations from expected frequency?
+
+**b) Pattern & Distribution Analysis:**
+- Analysis of even/odd and high/low balance
+- Significance of consecutive number occurrences
+- Sum range patterns and what they indicate
+
+**c) Winner Pattern Analysis:**
+- What patterns emerge from draws that had jackpot winners?
+- Are certain days or months more favorable?
+
+**d) Temporal Trends:**
+- Year-over-year consistency patterns
+- Which numbers are consistent performers across many years?
+- Any recent shifts in patterns?
+
+### 3. AI-RECOMMENDED TOP 5 NUMBER COMBINATIONS
+
+Based on ALL the statistical data provided (frequency, patterns, winner analysis, temporal trends, historical observations, and the 4 algorithmic predictions), generate your own 5 best combinations. For each:
+
+🎲 **Combination N:** [numbers]
+   - **Reasoning:** Why this combination based on the data
+   - **Key factors:** (e.g., hot numbers, balanced distribution, winner patterns)
+
+**Your combinations should:**
+- Be {numbers_to_pick} numbers between 1 and {max_num}
+- Consider ALL data: frequency, patterns, winner analysis, temporal trends
+- Have balanced even/odd and high/low distribution
+- Fall within the typical sum range given in the Sum Analysis section
+- Be clearly distinct from each other
+- Have solid statistical reasoning
+
+### 4. CONFIDENCE ASSESSMENT
+Rate each combination 1-5 stars (⭐) based on statistical strength.
+
+### 5. IMPORTANT DISCLAIMER ⚠️
+Remind users about the random nature of lottery draws and responsible gaming.
+
+**REMEMBER:** Be specific, reference actual numbers from the statistics. Make reasoning transparent and educational. Format in clean markdown.
+
+{_END_INSTRUCTION}
+
+---
+
+"""
+
 
 class AIAnalyzer:
     """
@@ -22,6 +216,8 @@ class AIAnalyzer:
     generates recommendations for likely number combinations.
     """
 
+    __slots__ = ("model", "_system_message", "_options")
+
     def __init__(self, model: Optional[str] = None):
         """
         Initialize AI Analyzer.
@@ -30,39 +226,42 @@ class AIAnalyzer:
             model: Ollama model name (defaults to config.OLLAMA_MODEL)
         """
         self.model = model or config.OLLAMA_MODEL
+        # Reused on every chat call so the request prefix never changes
+        self._system_message = {"role": "system", "content": _SYSTEM_PROMPT_TEXT}
+        self._options = {
+            # Low temperature and a fixed seed keep answers to the same
+            # statistics reproducible, which is what makes caching them sound
+            "temperature": 0.3,
+            "top_p": 0.9,
+            "seed": 42,
+            "num_predict": config.OLLAMA_NUM_PREDICT,  # Upper bound on tokens
+            # Set explicitly: Ollama's default window is smaller than a full
+            # prompt plus answer, and it truncates overflow silently
+            "num_ctx": config.OLLAMA_NUM_CTX,
+            "stop": [_END_OF_ANALYSIS],
+        }
         logger.info(f"AI Analyzer initialized with model: {self.model}")
 
-    def check_ollama_status(self) -> Dict[str, Any]:
+    def check_ollama_status(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Check if Ollama is running and the model is available.
 
+        Args:
+            refresh: Ask the server again instead of using the cached
+                model list
+
         Returns:
             Dictionary with status information
         """
         try:
-            # Try to list available models
-            models_response = ollama.list()
-
-            # Extract model names from response
-            available_models = []
-
-            # Handle Pydantic model response (ollama>=0.6.0)
-            if hasattr(models_response, "models"):
-                for model in models_response.models:
-                    if hasattr(model, "model"):
-                        available_models.append(model.model)
-            # Handle dict response (older versions)
-            elif isinstance(models_response, dict):
-                models_list = models_response.get("models", [])
-                for model in models_list:
-                    if isinstance(model, dict):
-                        model_name = model.get("model") or model.get("name", "")
-                        if model_name:
-                            available_models.append(model_name)
+            if refresh:
+                self.invalidate_status_cache()
+            available_models = self._list_models()
 
             # Check if configured model is available (exact or partial match)
-            model_available = any(
-                self.model in m or m.startswith(self.model) for m in available_models
+            available_set = frozenset(available_models)
+            model_available = self.model in available_set or any(
+                self.model in m or m.startswith(self.model) for m in available_set
             )
 
             return {
@@ -70,15 +269,89 @@ class AIAnalyzer:
                 "model_available": model_available,
                 "available_models": available_models,
                 "configured_model": self.model,
+                # Server-side concurrency limits (as seen by this process);
+                # they bound how many concurrent analyses Ollama runs at once
+                "server_settings": {
+                    "OLLAMA_NUM_PARALLEL": os.environ.get("OLLAMA_NUM_PARALLEL"),
+                    "OLLAMA_MAX_LOADED_MODELS": os.environ.get(
+                        "OLLAMA_MAX_LOADED_MODELS"
+                    ),
+                },
             }
         except Exception as e:
             logger.warning(f"Ollama status check failed: {str(e)}")
             return {"running": False, "error": str(e)}
 
+    @staticmethod
+    def invalidate_status_cache() -> None:
+        """Forget the cached model list so the next status check refetches it."""
+        global _model_list_cache
+        with _model_list_lock:
+            _model_list_cache = None
+
+    @staticmethod
+    def _list_models() -> List[str]:
+        """
+        Return the model names installed on the Ollama server.
+
+        The list is shared across instances and reused for _MODEL_LIST_TTL
+        seconds, so status checks don't hit /api/tags on every request.
+        Failures are not cached.
+
+        Returns:
+            List of model names
+        """
+        global _model_list_cache
+        with _model_list_lock:
+            cached = _model_list_cache
+        if cached is not None and time.monotonic() - cached[0] < _MODEL_LIST_TTL:
+            return list(cached[1])
+
+        models_response = ollama.list()
+
+        # Extract model names from response
+        available_models = []
+
+        # Handle Pydantic model response (ollama>=0.6.0)
+        if hasattr(models_response, "models"):
+            for model in models_response.models:
+                if hasattr(model, "model"):
+                    available_models.append(model.model)
+        # Handle dict response (older versions)
+        elif isinstance(models_response, dict):
+            models_list = models_response.get("models", [])
+            for model in models_list:
+                if isinstance(model, dict):
+                    model_name = model.get("model") or model.get("name", "")
+                    if model_name:
+                        available_models.append(model_name)
+
+        with _model_list_lock:
+            _model_list_cache = (time.monotonic(), available_models)
+        return list(available_models)
+
     def analyze_lottery_report(self, analysis_data: Dict) -> Dict[str, Any]:
         """
         Analyze lottery statistical report using AI.
 
+        Blocking wrapper around ``analyze_lottery_report_async``.
+
+        Args:
+            analysis_data: Complete analysis report from LotteryAnalyzer
+
+        Returns:
+            Dictionary containing AI analysis, summary, and top 5 predictions
+
+        Raises:
+            InternalServerException: If AI analysis fails
+        """
+        return asyncio.run(self.analyze_lottery_report_async(analysis_data))
+
+    async def analyze_lottery_report_async(self, analysis_data: Dict) -> Dict[str, Any]:
+        """
+        Analyze lottery statistical report using AI without blocking the
+        event loop.
+
         Args:
             analysis_data: Complete analysis report from LotteryAnalyzer
 
@@ -89,80 +362,257 @@ class AIAnalyzer:
             InternalServerException: If AI analysis fails
         """
         try:
-            # Extract key information from analysis
-            game_type = analysis_data.get("game_type", "Unknown")
-            total_draws = (
-                analysis_data.get("total_draws")
-                or analysis_data.get("overall_stats", {}).get("total_draws")
-                or analysis_data.get("summary", {}).get("total_draws", 0)
-            )
-            date_range = analysis_data.get("date_range", {})
+            # Identical reports get identical answers until the entry expires
+            cache_key = None
+            if config.CACHE_ENABLED:
+                cache_key = self._response_cache_key(analysis_data)
+                cached = self._get_cached_response(cache_key)
+                if cached is not None:
+                    logger.info(f"Returning cached AI analysis ({cache_key})")
+                    return {**cached, "cached": True}
 
             # Build comprehensive prompt directly from analysis_data
-            prompt = self._build_analysis_prompt_v2(analysis_data)
+            prompt = self._build_fitting_prompt(analysis_data)
 
             logger.info(f"Sending analysis to AI model: {self.model}")
-            logger.debug(f"Prompt length: {len(prompt)} characters")
-
-            # Call Ollama API
-            response = ollama.chat(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are an expert statistician and data analyst specializing in Philippine PCSO (Philippine Charity Sweepstakes Office) lottery analysis. "
-                            "You have deep knowledge of probability theory, statistical analysis, and pattern recognition. "
-                            "Your role is to analyze historical lottery draw data and provide intelligent, data-driven insights.\n\n"
-                            "IMPORTANT CONTEXT:\n"
-                            "- The Philippine PCSO operates multiple lottery games (Ultra Lotto 6/58, Grand Lotto 6/55, Super Lotto 6/49, Mega Lotto 6/45, Lotto 6/42)\n"
-                            "- Each game draws a specific number of balls from a fixed range (e.g., 6/58 means pick 6 numbers from 1-58)\n"
-                            "- Draws occur 2-3 times per week depending on the game\n"
-                            "- All draws are random and independent events\n\n"
-                            "YOUR ANALYTICAL APPROACH:\n"
-                            "1. Identify statistically significant patterns in the data\n"
-                            "2. Consider frequency analysis (hot/cold numbers)\n"
-                            "3. Examine distribution patterns (even/odd, high/low, consecutive)\n"
-                            "4. Analyze temporal trends (day of week patterns, recent vs historical)\n"
-                            "5. Evaluate multiple prediction algorithms\n"
-                            "6. Always acknowledge that past results do NOT guarantee future outcomes\n\n"
-                            "RESPONSE STYLE:\n"
-                            "- Be analytical but accessible to non-technical users\n"
-                            "- Use clear explanations without excessive jargon\n"
-                            "- Provide actionable insights\n"
-                            "- Always include a responsible gaming disclaimer\n"
-                            "- Format in markdown for readability"
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                options={
-                    "temperature": 0.7,  # Balanced creativity/consistency
-                    "top_p": 0.9,
-                    "num_predict": 4096,  # Max tokens for comprehensive response
-                },
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Prompt length: %d characters", len(prompt))
+
+            # Call Ollama API. The client's connection pool belongs to the
+            # running event loop, so each call opens its own client.
+            async with ollama.AsyncClient() as client:
+                response = await client.chat(**self._chat_request(prompt))
 
             ai_response = response["message"]["content"]
             logger.info(
                 f"AI analysis completed. Response length: {len(ai_response)} characters"
             )
 
-            return {
-                "success": True,
-                "model": self.model,
-                "game_type": game_type,
-                "analysis": ai_response,
-                "total_draws_analyzed": total_draws,
-                "date_range": date_range,
-            }
+            result = self._build_result(analysis_data, ai_response)
+            if cache_key is not None:
+                self._cache_response(cache_key, result)
+            return {**result, "cached": False}
 
+        except InternalServerException:
+            # Already descriptive (e.g. the prompt doesn't fit the context)
+            raise
         except Exception as e:
             logger.error(f"AI analysis failed: {str(e)}", exc_info=True)
             raise InternalServerException(
-                message="AI analysis failed",
-                details={"error": str(e), "model": self.model},
+                message="AI analysis failed", details={"model": self.model}
+            )
+
+    def analyze_lottery_report_stream(
+        self, analysis_data: Dict
+    ) -> Iterator[Union[str, Dict[str, Any]]]:
+        """
+        Analyze lottery statistical report using AI, yielding the response
+        while the model is still generating it.
+
+        Args:
+            analysis_data: Complete analysis report from LotteryAnalyzer
+
+        Yields:
+            Chunks of the analysis text as they arrive, then the same result
+            dictionary ``analyze_lottery_report`` returns as the final item
+
+        Raises:
+            InternalServerException: If AI analysis fails
+        """
+        cache_key = None
+        if config.CACHE_ENABLED:
+            cache_key = self._response_cache_key(analysis_data)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                logger.info(f"Streaming cached AI analysis ({cache_key})")
+                yield cached["analysis"]
+                yield {**cached, "cached": True}
+                return
+
+        chunks = []
+        try:
+            prompt = self._build_fitting_prompt(analysis_data)
+
+            logger.info(f"Streaming analysis from AI model: {self.model}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Prompt length: %d characters", len(prompt))
+
+            for part in ollama.chat(**self._chat_request(prompt), stream=True):
+                content = part["message"]["content"]
+                if content:
+                    chunks.append(content)
+                    yield content
+        except InternalServerException:
+            # Already descriptive (e.g. the prompt doesn't fit the context)
+            raise
+        except Exception as e:
+            logger.error(f"AI analysis stream failed: {str(e)}", exc_info=True)
+            raise InternalServerException(
+                message="AI analysis failed", details={"model": self.model}
+            )
+
+        ai_response = "".join(chunks)
+        logger.info(
+            f"AI analysis stream completed. Response length: {len(ai_response)} characters"
+        )
+
+        result = self._build_result(analysis_data, ai_response)
+        if cache_key is not None:
+            self._cache_response(cache_key, result)
+        yield {**result, "cached": False}
+
+    def _chat_request(self, prompt: str) -> Dict[str, Any]:
+        """
+        Build the keyword arguments of an Ollama chat call.
+
+        Args:
+            prompt: Analysis prompt for the user message
+
+        Returns:
+            Arguments for ``chat()``
+        """
+        return {
+            "model": self.model,
+            "messages": [self._system_message, {"role": "user", "content": prompt}],
+            "options": self._options,
+            # Keep the model (and its prompt cache) loaded between analyses
+            # instead of Ollama's 5 minute default
+            "keep_alive": config.OLLAMA_KEEP_ALIVE,
+        }
+
+    def _build_result(self, analysis_data: Dict, ai_response: str) -> Dict[str, Any]:
+        """
+        Package an AI response with the report details it was generated from.
+
+        Args:
+            analysis_data: Complete analysis report from LotteryAnalyzer
+            ai_response: Markdown analysis returned by the model
+
+        Returns:
+            Result dictionary for the API
+        """
+        # Extract key information from analysis
+        game_type = analysis_data.get("game_type", "Unknown")
+        total_draws = (
+            analysis_data.get("total_draws")
+            or analysis_data.get("overall_stats", {}).get("total_draws")
+            or analysis_data.get("summary", {}).get("total_draws", 0)
+        )
+        date_range = analysis_data.get("date_range", {})
+
+        return {
+            "success": True,
+            "model": self.model,
+            "game_type": game_type,
+            "analysis": ai_response,
+            "total_draws_analyzed": total_draws,
+            "date_range": date_range,
+        }
+
+    def _response_cache_key(self, analysis_data: Dict) -> str:
+        """
+        Fingerprint an analysis request for the response cache.
+
+        Args:
+            analysis_data: Complete analysis report from LotteryAnalyzer
+
+        Returns:
+            Hex digest of the model name and the canonical report JSON
+        """
+        payload = json_utils.dumps(
+            {"model": self.model, "analysis_data": analysis_data},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _get_cached_response(key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for ``key`` unless it is missing or expired."""
+        with _response_cache_lock:
+            entry = _response_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at > config.OLLAMA_CACHE_TTL:
+                del _response_cache[key]
+                return None
+            _response_cache.move_to_end(key)
+            return result
+
+    @staticmethod
+    def _cache_response(key: str, result: Dict[str, Any]) -> None:
+        """Store a result, evicting the least recently used entries."""
+        with _response_cache_lock:
+            _response_cache[key] = (time.monotonic(), result)
+            _response_cache.move_to_end(key)
+            while len(_response_cache) > config.OLLAMA_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+
+    def _build_fitting_prompt(self, analysis_data: Dict) -> str:
+        """
+        Build the analysis prompt, trimmed to fit the model's context window.
+
+        Sections in ``_DROPPABLE_SECTIONS`` are left out one at a time until
+        the prompt and the response budget fit in ``OLLAMA_NUM_CTX``.
+
+        Args:
+            analysis_data: Complete analysis report dictionary
+
+        Returns:
+            Prompt that fits the context window
+
+        Raises:
+            InternalServerException: If the prompt doesn't fit even without
+                the droppable sections
+        """
+        num_predict = self._options["num_predict"]
+        prompt = self._build_analysis_prompt_v2(analysis_data)
+        for section in _DROPPABLE_SECTIONS:
+            if self._prompt_fits(prompt, num_predict):
+                return prompt
+            if not analysis_data.get(section):
+                continue
+            logger.warning(
+                f"Prompt (~{self._estimate_tokens(prompt)} tokens) exceeds the "
+                f"{config.OLLAMA_NUM_CTX}-token context, dropping {section}"
+            )
+            analysis_data = {**analysis_data, section: {}}
+            prompt = self._build_analysis_prompt_v2(analysis_data)
+
+        if not self._prompt_fits(prompt, num_predict):
+            raise InternalServerException(
+                message="Analysis prompt exceeds the model context window",
+                details={
+                    "estimated_tokens": self._estimate_tokens(prompt),
+                    "num_ctx": config.OLLAMA_NUM_CTX,
+                    "num_predict": num_predict,
+                },
             )
+        return prompt
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Estimate the token count of ``text`` (rounded up)."""
+        return -(-len(text) // _CHARS_PER_TOKEN)
+
+    def _prompt_fits(self, prompt: str, num_predict: int) -> bool:
+        """
+        Check whether a prompt leaves room for the response in the context.
+
+        Args:
+            prompt: User message for the chat call
+            num_predict: Tokens reserved for the response
+
+        Returns:
+            True if the system and user messages plus ``num_predict`` fit
+            in ``OLLAMA_NUM_CTX``
+        """
+        budget = config.OLLAMA_NUM_CTX - num_predict - _CONTEXT_RESERVE
+        used = self._estimate_tokens(_SYSTEM_PROMPT_TEXT) + self._estimate_tokens(
+            prompt
+        )
+        return used <= budget
 
     def _build_analysis_prompt_v2(self, analysis_data: Dict) -> str:
         """
@@ -188,8 +638,7 @@ class AIAnalyzer:
             total_draws = 1
 
         # Parse game parameters
-        max_num = int(game_type.split("/")[-1])
-        numbers_to_pick = int(game_type.split("/")[0].split()[-1])
+        max_num, _, pick_ratio = _parse_game_type(game_type)
 
         overall_stats = analysis_data.get("overall_stats", {})
         day_analysis = analysis_data.get("day_analysis", {})
@@ -226,57 +675,82 @@ class AIAnalyzer:
         yoy_trends = temporal_patterns.get("year_over_year_trends", {})
 
         # === Build prompt sections ===
-        prompt = f"""# PCSO Lottery Statistical Analysis Request
+        # Everything that only depends on the game comes first so repeated
+        # requests share a cacheable prefix; the statistics follow it.
+        # Sections are written straight into one buffer rather than joined
+        # into intermediate strings and spliced together, and sections the
+        # analysis has no data for are left out instead of padding the
+        # prompt with placeholders.
+        buf = io.StringIO()
+        buf.write(_prompt_header(game_type))
+        buf.write(f"""## 📈 COMPREHENSIVE STATISTICAL DATA
 
-## 📊 LOTTERY GAME INFORMATION
-
-**Game Type:** {game_type} (Philippine PCSO)
 **Analysis Period:** {date_range.get("start", "N/A")} to {date_range.get("end", "N/A")}
 **Total Historical Draws:** {total_draws:,} draws
-**Number Range:** 1 to {max_num}
-**Numbers Per Draw:** {numbers_to_pick} numbers
-
----
 
-## 📈 COMPREHENSIVE STATISTICAL DATA
-
-### 1️⃣ FREQUENCY ANALYSIS
-
-**"Hot Numbers" (Most Frequent, Top 15):**
-{self._format_frequency_list(most_frequent)}
-
-**"Cold Numbers" (Least Frequent, Top 15):**
-{self._format_frequency_list(least_frequent)}
+### 1️⃣ FREQUENCY ANALYSIS""")
+        self._write_block(
+            buf,
+            '\n\n**"Hot Numbers" (Most Frequent, Top 15):**\n',
+            self._write_frequency_list,
+            most_frequent,
+        )
+        self._write_block(
+            buf,
+            '\n\n**"Cold Numbers" (Least Frequent, Top 15):**\n',
+            self._write_frequency_list,
+            least_frequent,
+        )
+        buf.write(f"""
 
 **Summary:**
 - Hot numbers (top 10): {hot_numbers[:10] if isinstance(hot_numbers, list) else "N/A"}
 - Cold numbers (top 10): {cold_numbers[:10] if isinstance(cold_numbers, list) else "N/A"}
 - Average frequency per number: {avg_frequency:.1f}
-- Expected avg frequency: {((total_draws * numbers_to_pick / max_num) if total_draws > 0 else 0):.1f}
-- Actual range: {least_frequent[-1][1] if least_frequent else "N/A"} to {most_frequent[0][1] if most_frequent else "N/A"}
-
----
-
-### 2️⃣ PATTERN & DISTRIBUTION ANALYSIS
-
-**Even/Odd Distribution:**
-{self._format_pattern_dict(even_odd.get("patterns", {}))}
-- Most common pattern: {even_odd.get("most_common_pattern", "N/A")}
-
-**High/Low Balance (midpoint: {high_low.get("mid_point", max_num // 2)}):**
-{self._format_pattern_dict(high_low.get("patterns", {}))}
-- Most common pattern: {high_low.get("most_common_pattern", "N/A")}
+- Expected avg frequency: {((total_draws * pick_ratio) if total_draws > 0 else 0):.1f}
+- Actual range: {least_frequent[-1][1] if least_frequent else "N/A"} to {most_frequent[0][1] if most_frequent else "N/A"}""")
+
+        section = buf.tell()
+        buf.write("\n\n---\n\n### 2️⃣ PATTERN & DISTRIBUTION ANALYSIS")
+        if even_odd:
+            buf.write("\n\n**Even/Odd Distribution:**")
+            self._write_block(
+                buf, "\n", self._write_pattern_dict, even_odd.get("patterns", {})
+            )
+            buf.write(
+                f"\n- Most common pattern: {even_odd.get('most_common_pattern', 'N/A')}"
+            )
+        if high_low:
+            buf.write(
+                f"\n\n**High/Low Balance (midpoint: {high_low.get('mid_point', max_num // 2)}):**"
+            )
+            self._write_block(
+                buf, "\n", self._write_pattern_dict, high_low.get("patterns", {})
+            )
+            buf.write(
+                f"\n- Most common pattern: {high_low.get('most_common_pattern', 'N/A')}"
+            )
+        if consecutive:
+            buf.write(f"""
 
 **Consecutive Numbers:**
 - Average consecutive per draw: {consecutive.get("average_consecutive", 0):.2f}
 - Max consecutive seen: {consecutive.get("max_consecutive", 0)}
-- Draws with consecutive numbers: {consecutive.get("draws_with_consecutive", 0):,} ({consecutive.get("percentage_with_consecutive", 0):.1f}%)
+- Draws with consecutive numbers: {consecutive.get("draws_with_consecutive", 0):,} ({consecutive.get("percentage_with_consecutive", 0):.1f}%)""")
+        if sum_analysis:
+            buf.write(f"""
 
 **Sum Analysis:**
 - Average sum: {sum_analysis.get("average_sum", 0):.1f}
 - Median sum: {sum_analysis.get("median_sum", 0):.1f}
 - Range: {sum_analysis.get("min_sum", 0)} to {sum_analysis.get("max_sum", 0)}
 - Std dev: {sum_analysis.get("std_dev", 0):.1f}
+- Typical sum range for combinations: {sum_analysis.get("average_sum", 0):.0f} ± {sum_analysis.get("std_dev", 0):.0f}""")
+        if not (even_odd or high_low or consecutive or sum_analysis):
+            self._rollback(buf, section)
+
+        if pattern_analysis:
+            buf.write(f"""
 
 ---
 
@@ -286,574 +760,357 @@ class AIAnalyzer:
 - Most common carryover count: {pattern_analysis.get("most_common_carryover", 0)}
 - Average new numbers per draw: {pattern_analysis.get("average_new_numbers", 0):.2f}
 - Average sum difference between draws: {pattern_analysis.get("average_sum_difference", 0):.1f}
-- Most common even/odd transition: {pattern_analysis.get("most_common_pattern_transition", "N/A")}
-{self._format_latest_draw(latest_draw)}
-
----
-
-### 4️⃣ WINNER ANALYSIS (Jackpot Winners)
-
-{self._format_winner_analysis(winner)}
-
----
-
-### 5️⃣ DAY-OF-WEEK ANALYSIS
-
-{self._format_day_analysis(day_analysis)}
-
----
-
-### 6️⃣ TEMPORAL PATTERNS
-
-**Day-of-Week Hot Numbers:**
-{self._format_temporal_day_of_week(temporal_patterns.get("by_day_of_week", {}))}
-
-**Year-over-Year Consistent Performers:**
-{self._format_consistent_performers(yoy_trends.get("consistent_performers", []))}
-
-**Distinct High Performers by Year:**
-{self._format_high_performers(yoy_trends.get("distinct_high_performers", []))}
-
----
-
-### 7️⃣ HISTORICAL OBSERVATIONS & INSIGHTS
-
-{self._format_historical_observations(historical_observations)}
-
----
-
-### 8️⃣ ALGORITHMIC PREDICTIONS (4 Different Methods)
-
-**Algorithm 1: Frequency-Based (Weighted by recent performance)**
-{self._format_prediction_list_detailed(top_preds)}
-
-**Algorithm 2: Winning Pattern Analysis (Based on actual winner characteristics)**
-{self._format_prediction_list_detailed(winning_preds)}
-
-**Algorithm 3: Pattern-Based (Considers distribution patterns)**
-{self._format_prediction_list_detailed(pattern_preds)}
-
-**Algorithm 4: Ultimate Multi-Dimensional (Combines all factors)**
-{self._format_prediction_list_detailed(ultimate_preds)}
-
----
-
-## 🎯 YOUR ANALYTICAL TASK
-
-Please provide a comprehensive analysis in the following format:
-
-### 1. EXECUTIVE SUMMARY (3-4 paragraphs)
-High-level overview of the most important findings from this {total_draws:,} draw dataset. Key statistical patterns, surprising trends, and what makes this game's distribution unique.
-
-### 2. STATISTICAL INSIGHTS (Detailed Analysis)
-
-**a) Frequency Analysis Interpretation:**
-- What do the hot/cold number patterns tell us?
-- Are there any statistically significant deviations from expected frequency?
-
-**b) Pattern & Distribution Analysis:**
-- Analysis of even/odd and high/low balance
-- Significance of consecutive number occurrences
-- Sum range patterns and what they indicate
-
-**c) Winner Pattern Analysis:**
-- What patterns emerge from draws that had jackpot winners?
-- Are certain days or months more favorable?
-
-**d) Temporal Trends:**
-- Year-over-year consistency patterns
-- Which numbers are consistent performers across many years?
-- Any recent shifts in patterns?
-
-### 3. AI-RECOMMENDED TOP 5 NUMBER COMBINATIONS
-
-Based on ALL the statistical data provided above (frequency, patterns, winner analysis, temporal trends, historical observations, and the 4 algorithmic predictions), generate your own 5 best combinations. For each:
+- Most common even/odd transition: {pattern_analysis.get("most_common_pattern_transition", "N/A")}""")
+            self._write_block(buf, "\n", self._write_latest_draw, latest_draw)
+
+        self._write_block(
+            buf,
+            "\n\n---\n\n### 4️⃣ WINNER ANALYSIS (Jackpot Winners)\n\n",
+            self._write_winner_analysis,
+            winner,
+        )
 
-🎲 **Combination N:** [numbers]
-   - **Reasoning:** Why this combination based on the data
-   - **Key factors:** (e.g., hot numbers, balanced distribution, winner patterns)
+        self._write_block(
+            buf,
+            "\n\n---\n\n### 5️⃣ DAY-OF-WEEK ANALYSIS\n\n",
+            self._write_day_analysis,
+            day_analysis,
+        )
 
-**Your combinations should:**
-- Be {numbers_to_pick} numbers between 1 and {max_num}
-- Consider ALL data: frequency, patterns, winner analysis, temporal trends
-- Have balanced even/odd and high/low distribution
-- Fall within the typical sum range ({sum_analysis.get("average_sum", 0):.0f} ± {sum_analysis.get("std_dev", 0):.0f})
-- Be clearly distinct from each other
-- Have solid statistical reasoning
+        section = buf.tell()
+        buf.write("\n\n---\n\n### 6️⃣ TEMPORAL PATTERNS")
+        wrote = self._write_block(
+            buf,
+            "\n\n**Day-of-Week Hot Numbers:**\n",
+            self._write_temporal_day_of_week,
+            temporal_patterns.get("by_day_of_week", {}),
+        )
+        wrote |= self._write_block(
+            buf,
+            "\n\n**Year-over-Year Consistent Performers:**\n",
+            self._write_consistent_performers,
+            yoy_trends.get("consistent_performers", []),
+        )
+        wrote |= self._write_block(
+            buf,
+            "\n\n**Distinct High Performers by Year:**\n",
+            self._write_high_performers,
+            yoy_trends.get("distinct_high_performers", []),
+        )
+        if not wrote:
+            self._rollback(buf, section)
+
+        self._write_block(
+            buf,
+            "\n\n---\n\n### 7️⃣ HISTORICAL OBSERVATIONS & INSIGHTS\n\n",
+            self._write_historical_observations,
+            historical_observations,
+        )
 
-### 4. CONFIDENCE ASSESSMENT
-Rate each combination 1-5 stars (⭐) based on statistical strength.
+        section = buf.tell()
+        buf.write("\n\n---\n\n### 8️⃣ ALGORITHMIC PREDICTIONS (4 Different Methods)")
+        wrote = False
+        for heading, preds in (
+            (
+                "Algorithm 1: Frequency-Based (Weighted by recent performance)",
+                top_preds,
+            ),
+            (
+                "Algorithm 2: Winning Pattern Analysis (Based on actual winner characteristics)",
+                winning_preds,
+            ),
+            (
+                "Algorithm 3: Pattern-Based (Considers distribution patterns)",
+                pattern_preds,
+            ),
+            (
+                "Algorithm 4: Ultimate Multi-Dimensional (Combines all factors)",
+                ultimate_preds,
+            ),
+        ):
+            wrote |= self._write_block(
+                buf,
+                f"\n\n**{heading}**\n",
+                self._write_prediction_list_detailed,
+                preds,
+            )
+        if not wrote:
+            self._rollback(buf, section)
 
-### 5. IMPORTANT DISCLAIMER ⚠️
-Remind users about the random nature of lottery draws and responsible gaming.
+        buf.write("\n")
 
----
+        return buf.getvalue()
 
-**REMEMBER:** Be specific, reference actual numbers from the statistics. Make reasoning transparent and educational. Format in clean markdown.
-"""
+    @staticmethod
+    def _write_block(
+        buf: io.StringIO,
+        heading: str,
+        write_body: Callable[[io.StringIO, Any], bool],
+        data: Any,
+    ) -> bool:
+        """
+        Write a heading followed by a section body, or nothing at all if the
+        body turns out to be empty.
 
-        return prompt
+        Args:
+            buf: Prompt buffer
+            heading: Text written before the body
+            write_body: ``_write_*`` method for the section
+            data: Section data passed to ``write_body``
 
-    def _format_pattern_dict(self, patterns: Dict) -> str:
-        """Format a pattern distribution dictionary."""
+        Returns:
+            True if the section was written
+        """
+        mark = buf.tell()
+        buf.write(heading)
+        if write_body(buf, data):
+            return True
+        AIAnalyzer._rollback(buf, mark)
+        return False
+
+    @staticmethod
+    def _rollback(buf: io.StringIO, mark: int) -> None:
+        """Discard everything written to ``buf`` after position ``mark``."""
+        buf.seek(mark)
+        buf.truncate()
+
+    def _write_pattern_dict(self, buf: io.StringIO, patterns: Dict) -> bool:
+        """Write a pattern distribution dictionary."""
         if not patterns:
-            return "No pattern data available"
-        # Sort by count descending
-        sorted_patterns = sorted(patterns.items(), key=lambda x: x[1], reverse=True)
-        lines = [f"- {pattern}: {count:,} draws" for pattern, count in sorted_patterns]
-        return "\n".join(lines)
-
-    def _format_latest_draw(self, latest_draw: Dict) -> str:
-        """Format the latest draw information."""
+            return False
+        # Sort by count descending, keeping only the top rows for large dicts
+        by_count = operator.itemgetter(1)
+        if len(patterns) > _MAX_PATTERN_ROWS:
+            sorted_patterns = heapq.nlargest(
+                _MAX_PATTERN_ROWS, patterns.items(), key=by_count
+            )
+        else:
+            sorted_patterns = sorted(patterns.items(), key=by_count, reverse=True)
+        sep = ""
+        for pattern, count in sorted_patterns:
+            buf.write(f"{sep}- {pattern}: {count:,} draws")
+            sep = "\n"
+        return True
+
+    def _write_latest_draw(self, buf: io.StringIO, latest_draw: Dict) -> bool:
+        """Write the latest draw information."""
         if not latest_draw:
-            return ""
-        return (
+            return False
+        buf.write(
             f"- Latest draw: {latest_draw.get('date', 'N/A')} → "
             f"{latest_draw.get('numbers', [])} (sum: {latest_draw.get('sum', 'N/A')})"
         )
+        return True
 
-    def _format_winner_analysis(self, winner: Dict) -> str:
-        """Format winner/jackpot analysis data."""
+    def _write_winner_analysis(self, buf: io.StringIO, winner: Dict) -> bool:
+        """Write winner/jackpot analysis data."""
         if not winner:
-            return "No winner analysis data available"
-
-        lines = []
+            return False
 
         total_wins = winner.get("total_winning_draws", 0)
         win_rate = winner.get("win_rate", 0)
-        lines.append(f"**Total Jackpot Wins:** {total_wins} ({win_rate}% of draws)")
+        buf.write(f"**Total Jackpot Wins:** {total_wins} ({win_rate}% of draws)")
 
         # Hot winning numbers
         hot_winning = winner.get("hot_winning_numbers", [])
         if hot_winning:
-            lines.append(f"**Hot Winning Numbers:** {hot_winning[:10]}")
+            buf.write(f"\n**Hot Winning Numbers:** {hot_winning[:10]}")
 
         # Most frequent winning numbers with counts
         freq_winning = winner.get("most_frequent_winning_numbers", [])
         if freq_winning:
             formatted = [f"{num} ({count}x)" for num, count in freq_winning[:10]]
-            lines.append(f"**Most Frequent in Winning Draws:** {', '.join(formatted)}")
+            buf.write(f"\n**Most Frequent in Winning Draws:** {', '.join(formatted)}")
 
         # Best winning days
         best_days = winner.get("best_winning_days", [])
         if best_days:
             formatted = [f"{day} ({count})" for day, count in best_days]
-            lines.append(f"**Best Winning Days:** {', '.join(formatted)}")
+            buf.write(f"\n**Best Winning Days:** {', '.join(formatted)}")
 
         # Best winning months
         best_months = winner.get("best_winning_months", [])
         if best_months:
-            month_names = {
-                1: "Jan",
-                2: "Feb",
-                3: "Mar",
-                4: "Apr",
-                5: "May",
-                6: "Jun",
-                7: "Jul",
-                8: "Aug",
-                9: "Sep",
-                10: "Oct",
-                11: "Nov",
-                12: "Dec",
-            }
-            formatted = [
-                f"{month_names.get(m, m)} ({count})" for m, count in best_months
-            ]
-            lines.append(f"**Best Winning Months:** {', '.join(formatted)}")
+            formatted = []
+            for m, count in best_months:
+                name = _MONTH_NAMES[m - 1] if isinstance(m, int) and 1 <= m <= 12 else m
+                formatted.append(f"{name} ({count})")
+            buf.write(f"\n**Best Winning Months:** {', '.join(formatted)}")
 
         # Winning even/odd patterns
         w_eo = winner.get("winning_even_odd_patterns", {})
         if w_eo:
-            lines.append(
-                f"**Winning Even/Odd Pattern:** {w_eo.get('most_common_pattern', 'N/A')} (most common)"
+            buf.write(
+                f"\n**Winning Even/Odd Pattern:** {w_eo.get('most_common_pattern', 'N/A')} (most common)"
             )
 
         # Winning high/low patterns
         w_hl = winner.get("winning_high_low_patterns", {})
         if w_hl:
-            lines.append(
-                f"**Winning High/Low Pattern:** {w_hl.get('most_common_pattern', 'N/A')} (most common)"
+            buf.write(
+                f"\n**Winning High/Low Pattern:** {w_hl.get('most_common_pattern', 'N/A')} (most common)"
             )
 
         # Jackpot stats
         jackpot = winner.get("jackpot_stats", {})
         if jackpot:
-            lines.append(
-                f"**Jackpot Stats:** Avg ₱{jackpot.get('average', 0):,.0f} | "
+            buf.write(
+                f"\n**Jackpot Stats:** Avg ₱{jackpot.get('average', 0):,.0f} | "
                 f"Min ₱{jackpot.get('min', 0):,.0f} | Max ₱{jackpot.get('max', 0):,.0f}"
             )
 
         # Next win probability
         nwp = winner.get("next_win_probability", {})
         if nwp:
-            lines.append(
-                f"**Win Frequency:** Avg {nwp.get('average_days_between_wins', 0):.0f} days between wins | "
+            buf.write(
+                f"\n**Win Frequency:** Avg {nwp.get('average_days_between_wins', 0):.0f} days between wins | "
                 f"Last win: {nwp.get('last_win_date', 'N/A')} | "
                 f"Days since: {nwp.get('days_since_last_win', 'N/A')}"
             )
 
-        return "\n".join(lines)
+        return True
 
-    def _format_day_analysis(self, day_analysis: Dict) -> str:
-        """Format the day_analysis section."""
+    def _write_day_analysis(self, buf: io.StringIO, day_analysis: Dict) -> bool:
+        """Write the day_analysis section."""
         if not day_analysis:
-            return "No day analysis data available"
-
-        lines = []
-        days_order = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
+            return False
 
-        for day in days_order:
-            day_data = day_analysis.get(day, {})
+        sep = ""
+        for day in _DAYS_ORDER:
+            # No default: a missing day is skipped, so don't allocate one
+            day_data = day_analysis.get(day)
             if not day_data:
                 continue
 
-            draws = day_data.get("total_draws", day_data.get("draw_count", 0))
-            msg = day_data.get("message", "")
-            hot = day_data.get("hot_numbers", [])
+            # Only fall back to draw_count when total_draws is absent
+            draws = day_data.get("total_draws")
+            if draws is None:
+                draws = day_data.get("draw_count", 0)
+            msg = day_data.get("message")
+            hot = day_data.get("hot_numbers")
 
             if draws > 0:
-                line = f"- **{day}:** {draws} draws"
+                buf.write(f"{sep}- **{day}:** {draws} draws")
                 if hot:
-                    line += f" | Hot: {hot[:6]}"
+                    buf.write(f" | Hot: {hot[:6]}")
                 if msg:
-                    line += f" | {msg}"
-                lines.append(line)
+                    buf.write(f" | {msg}")
+                sep = "\n"
             elif msg:
-                lines.append(f"- **{day}:** {msg}")
+                buf.write(f"{sep}- **{day}:** {msg}")
+                sep = "\n"
 
-        return "\n".join(lines) if lines else "No day analysis data"
+        return bool(sep)
 
-    def _format_temporal_day_of_week(self, by_dow: Dict) -> str:
-        """Format temporal patterns by day of week."""
+    def _write_temporal_day_of_week(self, buf: io.StringIO, by_dow: Dict) -> bool:
+        """Write temporal patterns by day of week."""
         if not by_dow:
-            return "No day-of-week temporal data available"
+            return False
 
-        lines = []
+        sep = ""
         for day, data in by_dow.items():
             if isinstance(data, dict):
                 draws = data.get("total_draws", 0)
                 hot = data.get("hot_numbers", [])
-                lines.append(f"- **{day}:** {draws} draws | Hot: {hot[:6]}")
+                buf.write(f"{sep}- **{day}:** {draws} draws | Hot: {hot[:6]}")
+                sep = "\n"
 
-        return "\n".join(lines) if lines else "No data"
+        return bool(sep)
 
-    def _format_consistent_performers(self, performers: List) -> str:
-        """Format year-over-year consistent performers."""
+    def _write_consistent_performers(self, buf: io.StringIO, performers: List) -> bool:
+        """Write year-over-year consistent performers."""
         if not performers:
-            return "No consistent performer data available"
+            return False
 
-        lines = []
+        sep = ""
         for p in performers[:10]:
             if isinstance(p, dict):
-                lines.append(
-                    f"- Number {p.get('number', '?')}: "
+                buf.write(
+                    f"{sep}- Number {p.get('number', '?')}: "
                     f"avg freq {p.get('average_frequency', 0):.1f}, "
                     f"consistency {p.get('consistency_score', 0):.3f}, "
                     f"appeared in {p.get('years_appeared', 0)} years"
                 )
+                sep = "\n"
 
-        return "\n".join(lines) if lines else "No data"
+        return bool(sep)
 
-    def _format_high_performers(self, performers: List) -> str:
-        """Format distinct high performers by year."""
+    def _write_high_performers(self, buf: io.StringIO, performers: List) -> bool:
+        """Write distinct high performers by year."""
         if not performers:
-            return "No high performer data available"
+            return False
 
-        lines = []
+        sep = ""
         for p in performers[:10]:
             if isinstance(p, dict):
-                lines.append(
-                    f"- Number {p.get('number', '?')} in {p.get('year', '?')}: "
+                buf.write(
+                    f"{sep}- Number {p.get('number', '?')} in {p.get('year', '?')}: "
                     f"freq {p.get('frequency', 0)}, "
                     f"{p.get('improvement_over_average', 0):.1f}% above average"
                 )
+                sep = "\n"
 
-        return "\n".join(lines) if lines else "No data"
+        return bool(sep)
 
-    def _format_historical_observations(self, observations: Dict) -> str:
-        """Format historical observations and insights."""
+    def _write_historical_observations(
+        self, buf: io.StringIO, observations: Dict
+    ) -> bool:
+        """Write historical observations and insights."""
         if not observations:
-            return "No historical observation data available"
+            return False
 
-        sections = []
+        sep = ""
 
         # Highly frequent numbers
         hf = observations.get("highly_frequent_numbers", [])
         if hf:
-            sections.append("**Highly Frequent Numbers:**")
+            buf.write("**Highly Frequent Numbers:**")
+            sep = "\n"
             for item in hf[:10]:
                 if isinstance(item, dict):
                     obs_text = item.get(
                         "observation", f"Number {item.get('number', '?')}"
                     )
-                    sections.append(f"- {obs_text}")
-
-        # Common repeating patterns
-        rp = observations.get("common_repeating_patterns", [])
-        if rp:
-            sections.append("\n**Common Repeating Patterns:**")
-            for item in rp[:8]:
-                if isinstance(item, dict):
-                    sections.append(f"- {item.get('observation', '')}")
-
-        # Year-to-year insights
-        yty = observations.get("year_to_year_insights", [])
-        if yty:
-            sections.append("\n**Year-to-Year Insights:**")
-            for item in yty[:8]:
-                if isinstance(item, dict):
-                    sections.append(f"- {item.get('observation', '')}")
-
-        # Consistency insights
-        ci = observations.get("consistency_insights", [])
-        if ci:
-            sections.append("\n**Consistency Insights:**")
-            for item in ci[:8]:
-                if isinstance(item, dict):
-                    sections.append(f"- {item.get('observation', '')}")
-
-        # Temporal insights
-        ti = observations.get("temporal_insights", [])
-        if ti:
-            sections.append("\n**Temporal/Seasonal Insights:**")
-            for item in ti[:8]:
+                    buf.write(f"\n- {obs_text}")
+
+        # The remaining sections share one layout: a title and up to eight
+        # observations each
+        for key, title in (
+            ("common_repeating_patterns", "Common Repeating Patterns"),
+            ("year_to_year_insights", "Year-to-Year Insights"),
+            ("consistency_insights", "Consistency Insights"),
+            ("temporal_insights", "Temporal/Seasonal Insights"),
+        ):
+            items = observations.get(key, [])
+            if not items:
+                continue
+            buf.write(f"{sep}\n**{title}:**")
+            sep = "\n"
+            for item in items[:8]:
                 if isinstance(item, dict):
-                    sections.append(f"- {item.get('observation', '')}")
-
-        return "\n".join(sections) if sections else "No historical observations"
-
-    def _build_analysis_prompt(
-        self,
-        game_type: str,
-        total_draws: int,
-        date_range: Dict,
-        predictions: Dict,
-        frequency_analysis: Dict,
-        pattern_analysis: Dict,
-        temporal_analysis: Dict,
-    ) -> str:
-        """
-        Build comprehensive analysis prompt for AI.
+                    buf.write(f"\n- {item.get('observation', '')}")
 
-        Args:
-            game_type: Type of lottery game
-            total_draws: Number of draws analyzed
-            date_range: Start and end dates
-            predictions: All prediction sets
-            frequency_analysis: Frequency statistics
-            pattern_analysis: Pattern analysis data
-            temporal_analysis: Temporal trend data
+        return bool(sep)
 
-        Returns:
-            Formatted prompt string
-        """
-        # Safety check for total_draws
-        if total_draws <= 0:
-            logger.warning(
-                f"Invalid total_draws value: {total_draws}. Using 1 as default."
-            )
-            total_draws = 1
-
-        # Extract max number from game type (e.g., "6/58" -> 58)
-        max_num = int(game_type.split("/")[-1])
-        numbers_to_pick = int(game_type.split("/")[0].split()[-1])
-
-        # Format top predictions from different methods
-        top_preds = predictions.get("top_predictions", [])[:5]
-        winning_preds = predictions.get("winning_predictions", [])[:5]
-        pattern_preds = predictions.get("pattern_based_predictions", [])[:5]
-        ultimate_preds = predictions.get("ultimate_predictions", [])[:5]
-
-        # Format frequency data
-        most_frequent = frequency_analysis.get("most_common", [])[:15]
-        least_frequent = frequency_analysis.get("least_common", [])[:15]
-
-        # Format pattern insights
-        consecutive_patterns = pattern_analysis.get("consecutive_patterns", {})
-        even_odd_dist = pattern_analysis.get("even_odd_distribution", {})
-        sum_ranges = pattern_analysis.get("sum_ranges", {})
-        high_low_balance = pattern_analysis.get("high_low_balance", {})
-
-        # Format temporal analysis
-        day_patterns = temporal_analysis.get("by_day", {})
-        recent_trends = temporal_analysis.get("recent_trends", {})
-
-        prompt = f"""# PCSO Lottery Statistical Analysis Request
-
-## 📊 LOTTERY GAME INFORMATION
-
-**Game Type:** {game_type} (Philippine PCSO)  
-**Analysis Period:** {date_range.get("start", "N/A")} to {date_range.get("end", "N/A")}  
-**Total Historical Draws:** {total_draws:,} draws  
-**Number Range:** 1 to {max_num}  
-**Numbers Per Draw:** {numbers_to_pick} numbers  
-
----
-
-## 📈 COMPREHENSIVE STATISTICAL DATA
-
-### 1️⃣ FREQUENCY ANALYSIS
-
-**"Hot Numbers" - Most Frequently Drawn (Top 15):**
-{self._format_frequency_list(most_frequent)}
-
-**"Cold Numbers" - Least Frequently Drawn (Top 15):**
-{self._format_frequency_list(least_frequent)}
-
-**Statistical Notes:**
-- Expected avg frequency per number: {((total_draws * numbers_to_pick / max_num) if total_draws > 0 else 0):.1f} appearances
-- Actual frequency range: {least_frequent[0][1] if least_frequent else "N/A"} to {most_frequent[0][1] if most_frequent else "N/A"}
-
----
-
-### 2️⃣ PATTERN DISTRIBUTION ANALYSIS
-
-**Consecutive Numbers:**
-- Total occurrences: {consecutive_patterns.get("total_occurrences", 0):,} times
-- Frequency: {((consecutive_patterns.get("total_occurrences", 0) / total_draws * 100) if total_draws > 0 else 0):.1f}% of draws
-
-**Even/Odd Distribution:**
-- Average Even numbers: {even_odd_dist.get("ratios", {}).get("even", 0):.1f}%
-- Average Odd numbers: {even_odd_dist.get("ratios", {}).get("odd", 0):.1f}%
-
-**High/Low Number Balance:**
-- High numbers (>{max_num // 2}): {high_low_balance.get("ratios", {}).get("high", 0):.1f}%
-- Low numbers (≤{max_num // 2}): {high_low_balance.get("ratios", {}).get("low", 0):.1f}%
-
-**Sum Range Analysis:**
-- Average sum of numbers: {sum_ranges.get("average_sum", 0):.1f}
-- Sum typically ranges: {sum_ranges.get("min_sum", 0)} to {sum_ranges.get("max_sum", 0)}
-
----
-
-### 3️⃣ TEMPORAL ANALYSIS
-
-**Day of Week Patterns:**
-{self._format_day_patterns(day_patterns)}
-
-**Recent Trends (Last 30 draws):**
-{self._format_recent_trends(recent_trends)}
-
----
-
-### 4️⃣ ALGORITHMIC PREDICTIONS
-
-Our system uses 4 different statistical algorithms. Here are their top predictions:
-
-**Algorithm 1: Frequency-Based (Weighted by recent performance)**
-{self._format_prediction_list_detailed(top_preds)}
-
-**Algorithm 2: Winning Pattern Analysis (Based on actual winner characteristics)**
-{self._format_prediction_list_detailed(winning_preds)}
-
-**Algorithm 3: Pattern-Based (Considers distribution patterns)**
-{self._format_prediction_list_detailed(pattern_preds)}
-
-**Algorithm 4: Ultimate Multi-Dimensional (Combines all factors)**
-{self._format_prediction_list_detailed(ultimate_preds)}
-
----
-
-## 🎯 YOUR ANALYTICAL TASK
-
-Please provide a comprehensive analysis in the following format:
-
-### 1. EXECUTIVE SUMMARY (3-4 paragraphs)
-Provide a high-level overview of the most important findings from this {total_draws:,} draw dataset. What are the key statistical patterns? Any surprising trends? What makes this game's distribution unique?
-
-### 2. STATISTICAL INSIGHTS (Detailed Analysis)
-
-**a) Frequency Analysis Interpretation:**
-- What do the hot/cold number patterns tell us?
-- Are there any statistically significant deviations?
-- How does actual vs expected frequency compare?
-
-**b) Pattern & Distribution Analysis:**
-- Analysis of even/odd and high/low balance
-- Significance of consecutive number occurrences
-- Sum range patterns and what they indicate
-
-**c) Temporal Trends:**
-- Day-of-week patterns and their relevance
-- Recent trend analysis - any shifts in patterns?
-
-### 3. AI-RECOMMENDED TOP 5 NUMBER COMBINATIONS
-
-Based on ALL the statistical data provided above, generate your own 5 combinations that you believe have good statistical backing. For each combination:
-
-**Format:**
-🎲 **Combination 1:** [number, number, number, number, number, number]
-   - **Reasoning:** Explain why this combination based on the statistics
-   - **Key factors:** (e.g., hot numbers, balanced distribution, recent trends)
-   
-(Repeat for all 5 combinations)
-
-**Your combinations should:**
-- Be {numbers_to_pick} numbers between 1 and {max_num}
-- Consider frequency, patterns, and temporal trends
-- Have balanced even/odd and high/low distribution when possible
-- Be clearly distinct from each other
-- Have solid statistical reasoning
-
-### 4. CONFIDENCE ASSESSMENT
-Rate each of your 5 combinations on a scale of 1-5 stars (⭐) based on statistical strength.
-
-### 5. IMPORTANT DISCLAIMER ⚠️
-Remind users about the random nature of lottery draws and responsible gaming.
-
----
-
-**REMEMBER:** 
-- Be specific and data-driven in your analysis
-- Reference actual numbers from the statistics provided
-- Make your reasoning transparent and educational
-- Format your response in clean, readable markdown
-- Balance statistical rigor with accessibility
-
-Please proceed with your comprehensive analysis.
-"""
-
-        return prompt
-
-    def _format_frequency_list(self, freq_list: List) -> str:
-        """Format frequency data for prompt."""
+    def _write_frequency_list(self, buf: io.StringIO, freq_list: List) -> bool:
+        """Write frequency data for prompt."""
         if not freq_list:
-            return "No data available"
+            return False
 
-        lines = []
+        sep = ""
         for num, count in freq_list:
-            lines.append(f"- Number {num}: {count} times")
-
-        return "\n".join(lines) if lines else "No data available"
-
-    def _format_prediction_list(self, pred_list: List) -> str:
-        """Format prediction combinations for prompt."""
-        if not pred_list:
-            return "No predictions available"
-
-        lines = []
-        for i, pred in enumerate(pred_list, 1):
-            numbers = pred.get("numbers", [])
-            score = pred.get("score", 0)
-            lines.append(f"   - Set {i}: {sorted(numbers)} (Score: {score:.3f})")
-
-        return "\n".join(lines) if lines else "No predictions available"
-
-    def _format_prediction_list_detailed(self, pred_list: List) -> str:
-        """Format prediction combinations with detailed info for prompt."""
+            buf.write(f"{sep}- Number {num}: {count} times")
+            sep = "\n"
+        return True
+
+    def _write_prediction_list_detailed(
+        self, buf: io.StringIO, pred_list: List
+    ) -> bool:
+        """Write prediction combinations with detailed info for prompt."""
         if not pred_list:
-            return "No predictions available"
+            return False
 
-        lines = []
+        sep = ""
         for i, pred in enumerate(pred_list, 1):
             numbers = sorted(pred.get("numbers", []))
             score = pred.get("score", 0)
@@ -862,72 +1119,12 @@ Please proceed with your comprehensive analysis.
             even_count = sum(1 for n in numbers if n % 2 == 0)
             odd_count = len(numbers) - even_count
 
-            lines.append(
-                f"   {i}. {numbers}\n"
+            buf.write(
+                f"{sep}   {i}. {numbers}\n"
                 f"      Score: {score:.3f} | Even/Odd: {even_count}/{odd_count}"
             )
-
-        return "\n".join(lines) if lines else "No predictions available"
-
-    def _format_day_patterns(self, day_patterns: Dict) -> str:
-        """Format day-of-week pattern data."""
-        if not day_patterns:
-            return "No day pattern data available"
-
-        days = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
-        lines = []
-
-        for day in days:
-            day_data = day_patterns.get(day, {})
-            draw_count = day_data.get("draw_count", 0)
-            if draw_count > 0:
-                hot_nums_data = day_data.get("hot_numbers", [])
-                # Ensure it's a list before slicing
-                if isinstance(hot_nums_data, list):
-                    hot_nums = hot_nums_data[:5]
-                    lines.append(
-                        f"- **{day}:** {draw_count} draws | "
-                        f"Hot: {hot_nums if hot_nums else 'N/A'}"
-                    )
-
-        return "\n".join(lines) if lines else "No day pattern data"
-
-    def _format_recent_trends(self, recent_trends: Dict) -> str:
-        """Format recent trend analysis."""
-        if not recent_trends:
-            return "No recent trend data available"
-
-        lines = []
-
-        # Most recent hot numbers
-        hot_nums_data = recent_trends.get("hot_numbers", [])
-        # Ensure it's a list before slicing
-        if isinstance(hot_nums_data, list):
-            hot_nums = hot_nums_data[:10]
-            if hot_nums:
-                lines.append(f"- **Trending Hot:** {hot_nums}")
-
-        # Most recent cold numbers
-        cold_nums_data = recent_trends.get("cold_numbers", [])
-        # Ensure it's a list before slicing
-        if isinstance(cold_nums_data, list):
-            cold_nums = cold_nums_data[:10]
-            if cold_nums:
-                lines.append(f"- **Trending Cold:** {cold_nums}")
-
-        # Recent pattern shifts
-        if "pattern_shift" in recent_trends:
-            lines.append(f"- **Pattern Shift:** {recent_trends['pattern_shift']}")
-
-        return "\n".join(lines) if lines else "No significant recent trends detected"
+            sep = "\n"
+        return True
 
 
 def test_ollama_connection():
@@ -936,21 +1133,25 @@ def test_ollama_connection():
         analyzer = AIAnalyzer()
         status = analyzer.check_ollama_status()
 
-        print("=" * 60)
-        print("Ollama Status Check")
-        print("=" * 60)
-        print(f"Running: {status.get('running')}")
-        print(f"Configured Model: {status.get('configured_model')}")
-        print(f"Model Available: {status.get('model_available')}")
+        # Collected and printed in one write rather than line by line
+        lines = [
+            "=" * 60,
+            "Ollama Status Check",
+            "=" * 60,
+            f"Running: {status.get('running')}",
+            f"Configured Model: {status.get('configured_model')}",
+            f"Model Available: {status.get('model_available')}",
+        ]
 
         if status.get("available_models"):
-            print("\nAvailable Models:")
-            for model in status["available_models"]:
-                print(f"  - {model}")
+            lines.append("\nAvailable Models:")
+            lines.extend(f"  - {model}" for model in status["available_models"])
 
         if not status.get("running"):
-            print(f"\nError: {status.get('error')}")
-            print("\nTo start Ollama, run: ollama serve")
+            lines.append(f"\nError: {status.get('error')}")
+            lines.append("\nTo start Ollama, run: ollama serve")
+
+        print("\n".join(lines))
 
         return status
 
@@ -5,7 +5,8 @@ Analyzes lottery draw results and calculates probability-based predictions.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional, Tuple
 from collections import Counter, defaultdict
 from datetime import datetime
 
@@ -22,6 +23,10 @@ class LotteryAnalyzer:
         "Saturday",
         "Sunday",
     ]
+    _DAY_INDEX = {day: idx for idx, day in enumerate(DAYS_OF_WEEK)}
+    # Prediction attempts drawn per batch; callers usually stop after the
+    # first few distinct combinations
+    _SAMPLE_BATCH_SIZE = 64
 
     def __init__(self, data: Dict):
         """
@@ -32,27 +37,83 @@ class LotteryAnalyzer:
         """
         self.data = data
         self.game_type = data["game_type"]
-        # Sort results by date (newest first)
-        self.results = sorted(
-            data["results"],
-            key=lambda x: datetime.strptime(x["date"], "%m/%d/%Y"),
-            reverse=True,
-        )
+        # Parse draw dates once and sort results by date (newest first); the
+        # stable sort keeps same-day draws in their original order
+        dates = pd.to_datetime([r["date"] for r in data["results"]], format="%m/%d/%Y")
+        order = np.argsort(-dates.asi8, kind="stable")
+        self.results = [data["results"][i] for i in order]
+        # Draw dates in the same order as self.results
+        self._dates = dates.values[order]
         self.df = self._create_dataframe()
 
         # Extract max number from game type (e.g., "Lotto 6/42" -> 42)
         self.max_number = int(self.game_type.split("/")[-1])
         self.numbers_to_pick = int(self.game_type.split("/")[0].split()[-1])
 
+        # Drawn numbers as an (n_draws, numbers_to_pick) matrix in the same
+        # order as self.results, for vectorized per-draw statistics
+        self._numbers = self._create_number_matrix()
+        self._rng = np.random.default_rng()
+        # Index into DAYS_OF_WEEK of each draw's day (-1 if unrecognized)
+        self._day_index = np.array(
+            [self._DAY_INDEX.get(r["day_of_week"], -1) for r in self.results],
+            dtype=np.int8,
+        )
+
     def _create_dataframe(self) -> pd.DataFrame:
         """Create pandas DataFrame from results."""
         if not self.results:
             return pd.DataFrame()
 
         df = pd.DataFrame(self.results)
-        df["date"] = pd.to_datetime(df["date"])
+        df["date"] = self._dates
         return df
 
+    def _create_number_matrix(self) -> np.ndarray:
+        """Stack the drawn numbers of every result into a 2-D array."""
+        if not self.results:
+            return np.empty((0, self.numbers_to_pick), dtype=np.int16)
+        return np.array([r["numbers"] for r in self.results], dtype=np.int16)
+
+    def _count_numbers(self, numbers: Optional[np.ndarray] = None) -> Counter:
+        """
+        Count how often each number was drawn.
+
+        Args:
+            numbers: Draw matrix to count (default: all draws)
+
+        Returns:
+            Counter of number -> times drawn, keyed in order of first
+            appearance so most_common() breaks ties the same way as counting
+            draw by draw
+        """
+        flat = (self._numbers if numbers is None else numbers).ravel()
+        freq = np.bincount(flat, minlength=self.max_number + 1)
+        drawn, first = np.unique(flat, return_index=True)
+        drawn = drawn[np.argsort(first)]
+        return Counter(dict(zip(drawn.tolist(), freq[drawn].tolist())))
+
+    @staticmethod
+    def _count_patterns(counts: np.ndarray, width: int, template: str) -> Dict:
+        """
+        Tally draws by a per-draw count, e.g. even numbers -> "2E-4O".
+
+        Args:
+            counts: Count for each draw (the first number of the pattern)
+            width: Numbers per draw
+            template: Pattern format taking the count and ``width - count``
+
+        Returns:
+            Dictionary of pattern -> number of draws, keyed in order of first
+            appearance
+        """
+        values, first, totals = np.unique(counts, return_index=True, return_counts=True)
+        order = np.argsort(first)
+        return {
+            template.format(value, width - value): total
+            for value, total in zip(values[order].tolist(), totals[order].tolist())
+        }
+
     def get_overall_statistics(self) -> Dict:
         """
         Calculate overall statistics for all draws.
@@ -60,12 +121,15 @@ class LotteryAnalyzer:
         Returns:
             Dictionary containing various statistics
         """
+        return self._overall_statistics
+
+    @cached_property
+    def _overall_statistics(self) -> Dict:
+        """Overall statistics, computed once per analyzer."""
         if self.df.empty:
             return {}
 
-        # Flatten all numbers
-        all_numbers = [num for result in self.results for num in result["numbers"]]
-        number_freq = Counter(all_numbers)
+        number_freq = self._count_numbers()
 
         # Calculate statistics
         stats = {
@@ -106,30 +170,28 @@ class LotteryAnalyzer:
         if day not in self.DAYS_OF_WEEK:
             raise ValueError(f"Invalid day. Must be one of: {self.DAYS_OF_WEEK}")
 
-        # Filter results for specific day
-        day_results = [r for r in self.results if r["day_of_week"] == day]
+        # Filter draws for specific day
+        day_numbers = self._numbers[self._day_index == self._DAY_INDEX[day]]
 
-        if not day_results:
+        if not len(day_numbers):
             return {
                 "day": day,
                 "total_draws": 0,
                 "message": f"No draws found for {day}",
             }
 
-        # Flatten numbers for this day
-        day_numbers = [num for result in day_results for num in result["numbers"]]
-        number_freq = Counter(day_numbers)
+        number_freq = self._count_numbers(day_numbers)
 
         stats = {
             "day": day,
-            "total_draws": len(day_results),
+            "total_draws": len(day_numbers),
             "most_frequent_numbers": sorted(
                 number_freq.items(), key=lambda x: x[1], reverse=True
             )[:10],
             "number_frequency": dict(number_freq),
             "hot_numbers": self._get_hot_numbers(number_freq, top_n=6),
             "predicted_combinations": self._generate_predictions_for_day(
-                day_results, top_n=5
+                number_freq, top_n=5
             ),
         }
 
@@ -154,16 +216,13 @@ class LotteryAnalyzer:
 
     def _analyze_even_odd(self) -> Dict:
         """Analyze even/odd number distribution."""
-        even_odd_patterns = defaultdict(int)
-
-        for result in self.results:
-            even_count = sum(1 for num in result["numbers"] if num % 2 == 0)
-            odd_count = len(result["numbers"]) - even_count
-            pattern = f"{even_count}E-{odd_count}O"
-            even_odd_patterns[pattern] += 1
+        even_counts = np.count_nonzero(self._numbers % 2 == 0, axis=1)
+        even_odd_patterns = self._count_patterns(
+            even_counts, self._numbers.shape[1], "{}E-{}O"
+        )
 
         return {
-            "patterns": dict(even_odd_patterns),
+            "patterns": even_odd_patterns,
             "most_common_pattern": max(even_odd_patterns.items(), key=lambda x: x[1])[
                 0
             ],
@@ -172,16 +231,13 @@ class LotteryAnalyzer:
     def _analyze_high_low(self) -> Dict:
         """Analyze high/low number distribution."""
         mid_point = self.max_number // 2
-        high_low_patterns = defaultdict(int)
-
-        for result in self.results:
-            low_count = sum(1 for num in result["numbers"] if num <= mid_point)
-            high_count = len(result["numbers"]) - low_count
-            pattern = f"{low_count}L-{high_count}H"
-            high_low_patterns[pattern] += 1
+        low_counts = np.count_nonzero(self._numbers <= mid_point, axis=1)
+        high_low_patterns = self._count_patterns(
+            low_counts, self._numbers.shape[1], "{}L-{}H"
+        )
 
         return {
-            "patterns": dict(high_low_patterns),
+            "patterns": high_low_patterns,
             "most_common_pattern": max(high_low_patterns.items(), key=lambda x: x[1])[
                 0
             ],
@@ -190,36 +246,28 @@ class LotteryAnalyzer:
 
     def _analyze_consecutive_numbers(self) -> Dict:
         """Analyze consecutive number patterns."""
-        consecutive_stats = []
-
-        for result in self.results:
-            sorted_nums = sorted(result["numbers"])
-            consecutive_count = 0
-
-            for i in range(len(sorted_nums) - 1):
-                if sorted_nums[i + 1] - sorted_nums[i] == 1:
-                    consecutive_count += 1
-
-            consecutive_stats.append(consecutive_count)
+        sorted_nums = np.sort(self._numbers, axis=1)
+        consecutive_stats = np.count_nonzero(np.diff(sorted_nums, axis=1) == 1, axis=1)
+        draws_with_consecutive = int(np.count_nonzero(consecutive_stats))
 
         return {
             "average_consecutive": np.mean(consecutive_stats),
-            "max_consecutive": max(consecutive_stats),
-            "draws_with_consecutive": sum(1 for c in consecutive_stats if c > 0),
+            "max_consecutive": int(consecutive_stats.max()),
+            "draws_with_consecutive": draws_with_consecutive,
             "percentage_with_consecutive": (
-                sum(1 for c in consecutive_stats if c > 0) / len(consecutive_stats)
+                draws_with_consecutive / len(consecutive_stats)
             )
             * 100,
         }
 
     def _analyze_sum_ranges(self) -> Dict:
         """Analyze sum of numbers in draws."""
-        sums = [sum(result["numbers"]) for result in self.results]
+        sums = self._numbers.sum(axis=1)
 
         return {
             "average_sum": np.mean(sums),
-            "min_sum": min(sums),
-            "max_sum": max(sums),
+            "min_sum": int(sums.min()),
+            "max_sum": int(sums.max()),
             "median_sum": np.median(sums),
             "std_dev": np.std(sums),
         }
@@ -235,8 +283,7 @@ class LotteryAnalyzer:
             List of predicted combinations with scores
         """
         # Get frequency of all numbers
-        all_numbers = [num for result in self.results for num in result["numbers"]]
-        number_freq = Counter(all_numbers)
+        number_freq = self._count_numbers()
 
         # Calculate weighted scores for each number
         max_freq = max(number_freq.values())
@@ -247,53 +294,23 @@ class LotteryAnalyzer:
             if num not in number_scores:
                 number_scores[num] = 0.1  # Small weight for missing numbers
 
-        # Generate combinations using weighted random selection
+        # Generate combinations using weighted random selection, with some
+        # randomness to avoid always picking the same numbers
         predictions = []
-        seen_combinations = set()
-
-        attempts = 0
-        max_attempts = top_n * 100
-
-        while len(predictions) < top_n and attempts < max_attempts:
-            attempts += 1
-
-            # Generate a combination favoring hot numbers with some randomness
-            numbers = list(number_scores.keys())
-            weights = list(number_scores.values())
-
-            # Add randomness to avoid always picking the same numbers
-            adjusted_weights = [w + np.random.random() * 0.3 for w in weights]
-
-            chosen = set()
-            for _ in range(self.numbers_to_pick):
-                if not numbers:
-                    break
 
-                # Select number based on weights
-                probs = np.array(adjusted_weights) / sum(adjusted_weights)
-                idx = np.random.choice(len(numbers), p=probs)
-                chosen.add(numbers[idx])
+        for combo in self._sample_combinations(number_scores, 0.3, top_n * 100):
+            # Calculate confidence score
+            score = self._calculate_combination_score(combo, number_scores)
 
-                # Remove selected number
-                numbers.pop(idx)
-                adjusted_weights.pop(idx)
-
-            if len(chosen) == self.numbers_to_pick:
-                combo = tuple(sorted(chosen))
-
-                if combo not in seen_combinations:
-                    seen_combinations.add(combo)
-
-                    # Calculate confidence score
-                    score = self._calculate_combination_score(combo, number_scores)
-
-                    predictions.append(
-                        {
-                            "numbers": list(combo),
-                            "confidence_score": round(score, 2),
-                            "analysis": self._analyze_combination(combo),
-                        }
-                    )
+            predictions.append(
+                {
+                    "numbers": list(combo),
+                    "confidence_score": round(score, 2),
+                    "analysis": self._analyze_combination(combo),
+                }
+            )
+            if len(predictions) == top_n:
+                break
 
         # Sort by confidence score
         predictions.sort(key=lambda x: x["confidence_score"], reverse=True)
@@ -301,16 +318,12 @@ class LotteryAnalyzer:
         return predictions[:top_n]
 
     def _generate_predictions_for_day(
-        self, day_results: List[Dict], top_n: int = 5
+        self, number_freq: Counter, top_n: int = 5
     ) -> List[Dict]:
-        """Generate predictions specific to a day of the week."""
-        if not day_results:
+        """Generate predictions from the number frequencies of one day of the week."""
+        if not number_freq:
             return []
 
-        # Get frequency for this day
-        day_numbers = [num for result in day_results for num in result["numbers"]]
-        number_freq = Counter(day_numbers)
-
         max_freq = max(number_freq.values()) if number_freq else 1
         number_scores = {num: freq / max_freq for num, freq in number_freq.items()}
 
@@ -321,42 +334,58 @@ class LotteryAnalyzer:
 
         # Generate combinations
         predictions = []
-        seen_combinations = set()
-        attempts = 0
-        max_attempts = top_n * 100
 
-        while len(predictions) < top_n and attempts < max_attempts:
-            attempts += 1
+        for combo in self._sample_combinations(number_scores, 0.3, top_n * 100):
+            score = self._calculate_combination_score(combo, number_scores)
 
-            numbers = list(number_scores.keys())
-            weights = list(number_scores.values())
-            adjusted_weights = [w + np.random.random() * 0.3 for w in weights]
+            predictions.append(
+                {"numbers": list(combo), "confidence_score": round(score, 2)}
+            )
+            if len(predictions) == top_n:
+                break
 
-            chosen = set()
-            for _ in range(self.numbers_to_pick):
-                if not numbers:
-                    break
+        predictions.sort(key=lambda x: x["confidence_score"], reverse=True)
+        return predictions[:top_n]
 
-                probs = np.array(adjusted_weights) / sum(adjusted_weights)
-                idx = np.random.choice(len(numbers), p=probs)
-                chosen.add(numbers[idx])
+    def _sample_combinations(
+        self, number_scores: Dict, noise: float, max_attempts: int
+    ) -> Iterator[Tuple]:
+        """
+        Draw distinct combinations weighted by number score.
 
-                numbers.pop(idx)
-                adjusted_weights.pop(idx)
+        Each attempt adds up to ``noise`` of uniform randomness to every score
+        and draws numbers_to_pick numbers without replacement. Attempts are
+        generated in batches with the Gumbel-top-k trick: the k largest
+        ``log(weight) + Gumbel noise`` keys of a row are a weighted sample
+        without replacement.
 
-            if len(chosen) == self.numbers_to_pick:
-                combo = tuple(sorted(chosen))
+        Args:
+            number_scores: Dictionary of number -> selection weight
+            noise: Maximum random amount added to each weight per attempt
+            max_attempts: Number of draws to try
 
-                if combo not in seen_combinations:
-                    seen_combinations.add(combo)
-                    score = self._calculate_combination_score(combo, number_scores)
+        Yields:
+            Sorted combinations in the order they were drawn, each at most once
+        """
+        k = self.numbers_to_pick
+        if len(number_scores) < k:
+            return
 
-                    predictions.append(
-                        {"numbers": list(combo), "confidence_score": round(score, 2)}
-                    )
+        numbers = np.fromiter(number_scores.keys(), dtype=np.int64)
+        weights = np.fromiter(number_scores.values(), dtype=np.float64)
+        seen_combinations = set()
 
-        predictions.sort(key=lambda x: x["confidence_score"], reverse=True)
-        return predictions[:top_n]
+        for start in range(0, max_attempts, self._SAMPLE_BATCH_SIZE):
+            shape = (min(self._SAMPLE_BATCH_SIZE, max_attempts - start), len(weights))
+            keys = np.log(weights + self._rng.random(shape) * noise)
+            keys += self._rng.gumbel(size=shape)
+            top = np.argpartition(-keys, k - 1, axis=1)[:, :k]
+            combos = np.sort(numbers[top], axis=1)
+
+            for combo in map(tuple, combos.tolist()):
+                if combo not in seen_combinations:
+                    seen_combinations.add(combo)
+                    yield combo
 
     def _calculate_combination_score(self, combo: Tuple, number_scores: Dict) -> float:
         """Calculate a confidence score for a combination."""
@@ -421,6 +450,23 @@ class LotteryAnalyzer:
 
         return ""
 
+    @cached_property
+    def _winning_mask(self) -> np.ndarray:
+        """Boolean mask over self.results of draws that had winners."""
+        return np.array(
+            [
+                bool(r.get("winners"))
+                and r["winners"] not in ["0", "N/A", "0 winner", "No winner"]
+                for r in self.results
+            ],
+            dtype=bool,
+        )
+
+    @cached_property
+    def _winning_draws(self) -> List[Dict]:
+        """Results that have winners (not "0" or "N/A")."""
+        return [r for r, won in zip(self.results, self._winning_mask) if won]
+
     def get_winner_analysis(self) -> Dict:
         """
         Analyze draws that had winners.
@@ -428,13 +474,12 @@ class LotteryAnalyzer:
         Returns:
             Dictionary containing winner-specific statistics
         """
-        # Filter results that have winners (not "0" or "N/A")
-        winning_draws = [
-            r
-            for r in self.results
-            if r.get("winners")
-            and r["winners"] not in ["0", "N/A", "0 winner", "No winner"]
-        ]
+        return self._winner_analysis
+
+    @cached_property
+    def _winner_analysis(self) -> Dict:
+        """Winner analysis, computed once per analyzer."""
+        winning_draws = self._winning_draws
 
         if not winning_draws:
             return {
@@ -447,38 +492,25 @@ class LotteryAnalyzer:
         winning_number_freq = Counter(winning_numbers)
 
         # Analyze winning dates
-        winning_dates = [
-            datetime.strptime(r["date"], "%m/%d/%Y")
-            if isinstance(r["date"], str)
-            else r["date"]
-            for r in winning_draws
-        ]
+        winning_dates = self._dates[self._winning_mask]
         winning_days = [r["day_of_week"] for r in winning_draws]
         winning_day_freq = Counter(winning_days)
 
         # Analyze winning months
-        winning_months = [d.month for d in winning_dates]
+        winning_months = pd.DatetimeIndex(winning_dates).month.tolist()
         winning_month_freq = Counter(winning_months)
 
-        # Analyze jackpot amounts (if numeric)
-        jackpot_amounts = []
-        for r in winning_draws:
-            jackpot = r.get("jackpot", "N/A")
-            if jackpot and jackpot != "N/A":
-                # Try to extract numeric value
-                try:
-                    # Remove commas and PHP symbol
-                    clean_jackpot = (
-                        str(jackpot)
-                        .replace(",", "")
-                        .replace("₱", "")
-                        .replace("PHP", "")
-                        .strip()
-                    )
-                    amount = float(clean_jackpot)
-                    jackpot_amounts.append(amount)
-                except ValueError, AttributeError:
-                    pass
+        # Analyze jackpot amounts (if numeric); "N/A" and other values that
+        # don't parse once commas and the PHP symbol are removed are dropped
+        jackpots = pd.Series([r.get("jackpot") for r in winning_draws], dtype="string")
+        jackpot_amounts = (
+            pd.to_numeric(
+                jackpots.str.replace(r"[,₱]|PHP", "", regex=True).str.strip(),
+                errors="coerce",
+            )
+            .dropna()
+            .to_numpy(dtype=np.float64)
+        )
 
         analysis = {
             "total_winning_draws": len(winning_draws),
@@ -509,14 +541,14 @@ class LotteryAnalyzer:
             # Jackpot statistics (if available)
             "jackpot_stats": {
                 "count": len(jackpot_amounts),
-                "average": round(np.mean(jackpot_amounts), 2) if jackpot_amounts else 0,
-                "min": round(min(jackpot_amounts), 2) if jackpot_amounts else 0,
-                "max": round(max(jackpot_amounts), 2) if jackpot_amounts else 0,
+                "average": round(jackpot_amounts.mean(), 2),
+                "min": round(jackpot_amounts.min(), 2),
+                "max": round(jackpot_amounts.max(), 2),
             }
-            if jackpot_amounts
+            if len(jackpot_amounts)
             else None,
             # Probability predictions
-            "next_win_probability": self._predict_next_win_probability(winning_draws),
+            "next_win_probability": self._predict_next_win_probability(winning_dates),
         }
 
         return analysis
@@ -549,43 +581,32 @@ class LotteryAnalyzer:
             }
         return {"patterns": {}, "most_common_pattern": None}
 
-    def _predict_next_win_probability(self, winning_draws: List[Dict]) -> Dict:
+    def _predict_next_win_probability(self, winning_dates: np.ndarray) -> Dict:
         """
         Predict probability patterns for next potential win.
 
+        Args:
+            winning_dates: Dates of the draws that had winners
+
         Returns:
             Dictionary with probability predictions
         """
-        if not winning_draws:
+        if not len(winning_dates):
             return {}
 
         # Analyze time gaps between wins
-        winning_dates = []
-        for r in winning_draws:
-            try:
-                if isinstance(r["date"], str):
-                    date = datetime.strptime(r["date"], "%m/%d/%Y")
-                else:
-                    date = r["date"]
-                winning_dates.append(date)
-            except ValueError, KeyError:
-                continue
-
-        winning_dates.sort()
+        winning_dates = np.sort(winning_dates)
 
         # Calculate days between wins
         if len(winning_dates) > 1:
-            gaps = [
-                (winning_dates[i + 1] - winning_dates[i]).days
-                for i in range(len(winning_dates) - 1)
-            ]
+            gaps = np.diff(winning_dates).astype("timedelta64[D]").astype(int)
 
             avg_gap = np.mean(gaps)
             median_gap = np.median(gaps)
             std_gap = np.std(gaps)
 
             # Predict next win window
-            last_win = winning_dates[-1]
+            last_win = pd.Timestamp(winning_dates[-1]).to_pydatetime()
             days_since_last_win = (datetime.now() - last_win).days
 
             # Calculate probability zones
@@ -633,12 +654,7 @@ class LotteryAnalyzer:
             List of predicted combinations optimized for wins
         """
         # Get winning draws
-        winning_draws = [
-            r
-            for r in self.results
-            if r.get("winners")
-            and r["winners"] not in ["0", "N/A", "0 winner", "No winner"]
-        ]
+        winning_draws = self._winning_draws
 
         if not winning_draws:
             # Fall back to regular predictions
@@ -656,8 +672,7 @@ class LotteryAnalyzer:
         }
 
         # Add other numbers with lower scores
-        all_numbers = [num for result in self.results for num in result["numbers"]]
-        all_freq = Counter(all_numbers)
+        all_freq = self._count_numbers()
         for num in range(1, self.max_number + 1):
             if num not in number_scores:
                 number_scores[num] = (
@@ -666,59 +681,31 @@ class LotteryAnalyzer:
 
         # Generate combinations
         predictions = []
-        seen_combinations = set()
-        attempts = 0
-        max_attempts = top_n * 100
-
-        while len(predictions) < top_n and attempts < max_attempts:
-            attempts += 1
 
-            numbers = list(number_scores.keys())
-            weights = list(number_scores.values())
-            adjusted_weights = [w + np.random.random() * 0.2 for w in weights]
+        for combo in self._sample_combinations(number_scores, 0.2, top_n * 100):
+            score = self._calculate_winning_score(combo, number_scores)
 
-            chosen = set()
-            for _ in range(self.numbers_to_pick):
-                if not numbers:
-                    break
-
-                probs = np.array(adjusted_weights) / sum(adjusted_weights)
-                idx = np.random.choice(len(numbers), p=probs)
-                chosen.add(numbers[idx])
-
-                numbers.pop(idx)
-                adjusted_weights.pop(idx)
-
-            if len(chosen) == self.numbers_to_pick:
-                combo = tuple(sorted(chosen))
-
-                if combo not in seen_combinations:
-                    seen_combinations.add(combo)
-                    score = self._calculate_winning_score(
-                        combo, number_scores, winning_draws
-                    )
-
-                    predictions.append(
-                        {
-                            "numbers": list(combo),
-                            "win_probability_score": round(score, 2),
-                            "analysis": self._analyze_combination(combo),
-                            "prediction_type": "Winner-Optimized",
-                        }
-                    )
+            predictions.append(
+                {
+                    "numbers": list(combo),
+                    "win_probability_score": round(score, 2),
+                    "analysis": self._analyze_combination(combo),
+                    "prediction_type": "Winner-Optimized",
+                }
+            )
+            if len(predictions) == top_n:
+                break
 
         predictions.sort(key=lambda x: x["win_probability_score"], reverse=True)
         return predictions[:top_n]
 
-    def _calculate_winning_score(
-        self, combo: Tuple, number_scores: Dict, winning_draws: List[Dict]
-    ) -> float:
+    def _calculate_winning_score(self, combo: Tuple, number_scores: Dict) -> float:
         """Calculate score based on winning patterns."""
         # Base score from winning number frequencies
         base_score = sum(number_scores.get(num, 0) for num in combo) / len(combo)
 
         # Check if combo matches winning patterns
-        winning_patterns = self._analyze_pattern_for_draws(winning_draws, "even_odd")
+        winning_patterns = self.get_winner_analysis()["winning_even_odd_patterns"]
         combo_even = sum(1 for num in combo if num % 2 == 0)
         combo_pattern = f"{combo_even}E-{len(combo) - combo_even}O"
 
@@ -740,6 +727,11 @@ class LotteryAnalyzer:
         Returns:
             Dictionary with pattern analysis and predictions
         """
+        return self._consecutive_draw_patterns
+
+    @cached_property
+    def _consecutive_draw_patterns(self) -> Dict:
+        """Consecutive draw patterns, computed once per analyzer."""
         if len(self.results) < 2:
             return {"message": "Insufficient data for consecutive draw analysis"}
 
@@ -834,8 +826,7 @@ class LotteryAnalyzer:
         latest_numbers = set(latest_draw["numbers"])
 
         # Get frequency data
-        all_numbers = [num for result in self.results for num in result["numbers"]]
-        number_freq = Counter(all_numbers)
+        number_freq = self._count_numbers()
 
         # Expected carryover count
         expected_carryover = int(round(pattern_analysis["average_carryover"]))
@@ -933,8 +924,7 @@ class LotteryAnalyzer:
         carryover_score = max(0, 1 - (carryover_diff / self.numbers_to_pick))
 
         # Frequency score
-        all_numbers = [num for result in self.results for num in result["numbers"]]
-        number_freq = Counter(all_numbers)
+        number_freq = self._count_numbers()
         max_freq = max(number_freq.values())
         freq_score = sum(number_freq.get(num, 0) for num in combo) / (
             len(combo) * max_freq
@@ -958,6 +948,11 @@ class LotteryAnalyzer:
         Returns:
             Dictionary containing temporal pattern analysis
         """
+        return self._temporal_patterns
+
+    @cached_property
+    def _temporal_patterns(self) -> Dict:
+        """Temporal pattern analysis, computed once per analyzer."""
         if self.df.empty:
             return {}
 
@@ -1219,8 +1214,12 @@ class LotteryAnalyzer:
         Returns:
             Dictionary containing key observations about the lottery data
         """
-        all_numbers = [num for result in self.results for num in result["numbers"]]
-        number_freq = Counter(all_numbers)
+        return self._historical_observations
+
+    @cached_property
+    def _historical_observations(self) -> Dict:
+        """Historical observations, computed once per analyzer."""
+        number_freq = self._count_numbers()
 
         observations = {
             "highly_frequent_numbers": [],
@@ -1326,8 +1325,7 @@ class LotteryAnalyzer:
             List of comprehensive predictions with detailed analysis
         """
         # Get all analysis components
-        all_numbers = [num for result in self.results for num in result["numbers"]]
-        number_freq = Counter(all_numbers)
+        number_freq = self._count_numbers()
         temporal_patterns = self.analyze_temporal_patterns()
         historical_obs = self.get_historical_observations()
 
@@ -1358,12 +1356,7 @@ class LotteryAnalyzer:
             number_scores[num] += (freq / max_recent) * 0.20
 
         # 4. Winning draw performance (15% weight)
-        winning_draws = [
-            r
-            for r in self.results
-            if r.get("winners")
-            and r["winners"] not in ["0", "N/A", "0 winner", "No winner"]
-        ]
+        winning_draws = self._winning_draws
 
         if winning_draws:
             winning_numbers = [
@@ -1393,99 +1386,67 @@ class LotteryAnalyzer:
 
         # Generate predictions
         predictions = []
-        seen_combinations = set()
-        attempts = 0
-        max_attempts = top_n * 500
 
         # Get recent pattern preferences
         recent_even_odd = self._get_recent_pattern_preference("even_odd")
         recent_high_low = self._get_recent_pattern_preference("high_low")
 
-        while len(predictions) < top_n and attempts < max_attempts:
-            attempts += 1
-
-            # Weighted random selection with controlled randomness
-            numbers = list(number_scores.keys())
-            weights = list(number_scores.values())
-
-            # Add controlled randomness (acknowledging lottery randomness)
-            randomness_factor = np.random.random(len(weights)) * 0.4
-            adjusted_weights = [w + r for w, r in zip(weights, randomness_factor)]
-
-            chosen = set()
-            temp_numbers = numbers.copy()
-            temp_weights = adjusted_weights.copy()
-
-            for _ in range(self.numbers_to_pick):
-                if not temp_numbers:
-                    break
-
-                # Probabilistic selection
-                probs = np.array(temp_weights) / sum(temp_weights)
-                idx = np.random.choice(len(temp_numbers), p=probs)
-                chosen.add(temp_numbers[idx])
-
-                # Remove selected number
-                temp_numbers.pop(idx)
-                temp_weights.pop(idx)
-
-            if len(chosen) == self.numbers_to_pick:
-                combo = tuple(sorted(chosen))
-
-                if combo not in seen_combinations:
-                    seen_combinations.add(combo)
-
-                    # Calculate comprehensive score
-                    confidence = self._calculate_ultimate_score(
-                        combo, number_scores, temporal_patterns, historical_obs
-                    )
+        # Weighted random selection with controlled randomness (acknowledging
+        # lottery randomness)
+        for combo in self._sample_combinations(number_scores, 0.4, top_n * 500):
+            # Calculate comprehensive score
+            confidence = self._calculate_ultimate_score(
+                combo, number_scores, temporal_patterns, historical_obs
+            )
 
-                    # Detailed analysis
-                    analysis = self._analyze_combination(combo)
-                    analysis["randomness_acknowledgment"] = (
-                        "While based on historical patterns, lottery draws are random. "
-                        "Past performance does not guarantee future results."
-                    )
+            # Detailed analysis
+            analysis = self._analyze_combination(combo)
+            analysis["randomness_acknowledgment"] = (
+                "While based on historical patterns, lottery draws are random. "
+                "Past performance does not guarantee future results."
+            )
 
-                    predictions.append(
-                        {
-                            "numbers": list(combo),
-                            "ultimate_confidence_score": round(float(confidence), 2),
-                            "analysis": analysis,
-                            "prediction_type": "Ultimate Analysis",
-                            "scoring_components": {
-                                "frequency_score": round(
-                                    float(
-                                        sum(number_scores.get(n, 0) for n in combo)
-                                        / len(combo)
-                                        * 30
-                                    ),
-                                    2,
-                                ),
-                                "pattern_match": round(
-                                    float(
-                                        self._pattern_match_score(
-                                            combo, recent_even_odd, recent_high_low
-                                        )
-                                        * 25
-                                    ),
-                                    2,
-                                ),
-                                "temporal_consistency": round(
-                                    float(
-                                        self._temporal_consistency_score(
-                                            combo, temporal_patterns
-                                        )
-                                        * 25
-                                    ),
-                                    2,
-                                ),
-                                "balance_score": round(
-                                    float(self._balance_score(combo) * 20), 2
-                                ),
-                            },
-                        }
-                    )
+            predictions.append(
+                {
+                    "numbers": list(combo),
+                    "ultimate_confidence_score": round(float(confidence), 2),
+                    "analysis": analysis,
+                    "prediction_type": "Ultimate Analysis",
+                    "scoring_components": {
+                        "frequency_score": round(
+                            float(
+                                sum(number_scores.get(n, 0) for n in combo)
+                                / len(combo)
+                                * 30
+                            ),
+                            2,
+                        ),
+                        "pattern_match": round(
+                            float(
+                                self._pattern_match_score(
+                                    combo, recent_even_odd, recent_high_low
+                                )
+                                * 25
+                            ),
+                            2,
+                        ),
+                        "temporal_consistency": round(
+                            float(
+                                self._temporal_consistency_score(
+                                    combo, temporal_patterns
+                                )
+                                * 25
+                            ),
+                            2,
+                        ),
+                        "balance_score": round(
+                            float(self._balance_score(combo) * 20), 2
+                        ),
+                    },
+                }
+            )
+            if len(predictions) == top_n:
+                break
 
         # Sort by ultimate confidence score
         predictions.sort(key=lambda x: x["ultimate_confidence_score"], reverse=True)
@@ -1586,8 +1547,7 @@ class LotteryAnalyzer:
         Returns:
             Dictionary containing data formatted for charts
         """
-        all_numbers = [num for result in self.results for num in result["numbers"]]
-        number_freq = Counter(all_numbers)
+        number_freq = self._count_numbers()
 
         # Frequency distribution
         freq_data = {
@@ -1677,13 +1637,10 @@ class LotteryAnalyzer:
         # Heatmap 3: Day of week frequency
         day_number_freq = np.zeros((self.max_number, 7))
 
-        for idx, day in enumerate(self.DAYS_OF_WEEK):
-            day_data = [r for r in self.results if r["day_of_week"] == day]
-            day_numbers = [num for result in day_data for num in result["numbers"]]
-            day_freq = Counter(day_numbers)
-
-            for num in range(1, self.max_number + 1):
-                day_number_freq[num - 1][idx] = day_freq.get(num, 0)
+        for idx in range(len(self.DAYS_OF_WEEK)):
+            day_numbers = self._numbers[self._day_index == idx].ravel()
+            day_freq = np.bincount(day_numbers, minlength=self.max_number + 1)
+            day_number_freq[:, idx] = day_freq[1 : self.max_number + 1]
 
         return {
             "by_month": {
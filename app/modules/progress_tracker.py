@@ -340,37 +340,45 @@ class ProgressTracker:
         Returns:
             Number of tasks cleaned up
         """
-        if not os.path.exists(self.progress_dir):
-            return 0
-
         current_time = time.time()
         max_age_seconds = max_age_hours * 3600
-        cleaned_count = 0
+        expired = []
 
-        for filename in os.listdir(self.progress_dir):
-            if not filename.endswith(".json"):
-                continue
+        try:
+            entries = os.scandir(self.progress_dir)
+        except FileNotFoundError:
+            return 0
 
-            filepath = os.path.join(self.progress_dir, filename)
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
 
-            try:
-                with open(filepath, "r") as f:
-                    data = json.load(f)
+                try:
+                    # updated_at is never newer than the file's mtime, so a
+                    # recently written file can be skipped without parsing it
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                    if current_time - mtime <= max_age_seconds:
+                        continue
 
-                updated_at = data.get("updated_at", 0)
-                age = current_time - updated_at
+                    with open(entry.path, "r") as f:
+                        data = json.load(f)
 
-                if age > max_age_seconds:
-                    os.remove(filepath)
-                    cleaned_count += 1
+                    updated_at = data.get("updated_at", 0)
+                    if current_time - updated_at > max_age_seconds:
+                        expired.append(entry.path)
 
-            except json.JSONDecodeError, IOError, OSError:
-                # If file is corrupted, remove it
-                try:
-                    os.remove(filepath)
-                    cleaned_count += 1
-                except OSError:
-                    pass
+                except json.JSONDecodeError, IOError, OSError:
+                    # If file is corrupted, remove it
+                    expired.append(entry.path)
+
+        cleaned_count = 0
+        for filepath in expired:
+            try:
+                os.remove(filepath)
+                cleaned_count += 1
+            except OSError:
+                pass
 
         return cleaned_count
 